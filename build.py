@@ -68,6 +68,7 @@ def build_onefile() -> None:
         "--hidden-import", "src",
         "--hidden-import", "aiohttp",
         "--hidden-import", "aiofiles",
+        "--hidden-import", "orjson",
         "--hidden-import", "pydantic",
         "--hidden-import", "pydantic_core",
         "--hidden-import", "requests",
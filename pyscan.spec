@@ -18,7 +18,7 @@ if not uv_bin:
         "Instala el paquete pip 'uv' o asegurate de que 'uv' este en el PATH."
     )
 
-hiddenimports =['aiohttp', 'pydantic', 'pydantic_core', 'requests', 'openpyxl', 'et_xmlfile', 'dotenv', 'certifi', 'multidict', 'yarl', 'aiofiles', 'annotated_types', 'typing_extensions', 'click', 'charset_normalizer', 'idna', 'urllib3']
+hiddenimports =['aiohttp', 'pydantic', 'pydantic_core', 'requests', 'openpyxl', 'et_xmlfile', 'dotenv', 'certifi', 'multidict', 'yarl', 'aiofiles', 'orjson', 'annotated_types', 'typing_extensions', 'click', 'charset_normalizer', 'idna', 'urllib3']
 hiddenimports += collect_submodules('src')
 hiddenimports += collect_submodules('openpyxl')
 hiddenimports += collect_submodules('pydantic')
@@ -113,7 +113,7 @@ class ApplicationFactory:
             try:
                 result = await orchestrator.run(request)
             finally:
-                container.close()  # Clean up resources
+                await container.aclose()  # Clean up resources
         """
         container = DependencyContainer()
         factory = cls(container)
@@ -33,6 +33,30 @@ _DEFAULT_POLICY = Policy(
     maintainability_years_threshold=2,
 )
 
+# _short_license runs once per package in the report; compile its patterns once
+_QUOTES_RE = re.compile(r'["\\\']')
+_NOISE_WORDS_RE = re.compile(r'\b(new|revised|or)\b')
+_WS_RE = re.compile(r'\s+')
+_SPDX_CANDIDATE_RE = re.compile(r'^([A-Za-z0-9.+\-]+(?:\-[0-9.]+)?)(?:\s|$)')
+
+# License pattern mapping: (regex_pattern, spdx_identifier), first match wins
+_SHORT_LICENSE_PATTERNS = tuple((re.compile(pattern), identifier) for pattern, identifier in (
+    (r'\bmit\b(?!\w)', 'MIT'),
+    (r'\bbsd[- ]?3', 'BSD-3-Clause'),
+    (r'\bbsd[- ]?2', 'BSD-2-Clause'),
+    (r'\bbsd\b', 'BSD'),
+    (r'\bapache[- ]?2', 'Apache-2.0'),
+    (r'\bapache\b', 'Apache'),
+    (r'\bgpl[- ]?3', 'GPL-3.0'),
+    (r'\bgpl[- ]?2', 'GPL-2.0'),
+    (r'\bgpl\b', 'GPL'),
+    (r'\blgpl\b', 'LGPL'),
+    (r'\bmpl\b', 'MPL'),
+    (r'\bepl\b', 'EPL'),
+    (r'\b(unlicense|public\s+domain)\b', 'Public Domain'),
+    (r'\b(proprietary|all\s+rights\s+reserved)\b', 'Proprietary'),
+))
+
 
 class AnalyzePackagesUseCase:
     """Use case for analyzing packages with dependencies and vulnerabilities."""
@@ -91,9 +115,12 @@ class AnalyzePackagesUseCase:
                 self.metadata_provider.reset_cache_stats()
 
             enrich_start = time.time()
-            enriched_packages = await asyncio.gather(
-                *(self.metadata_provider.enrich_package_metadata(pkg) for pkg in all_packages)
-            )
+            async with asyncio.TaskGroup() as tg:
+                enrich_tasks = [
+                    tg.create_task(self.metadata_provider.enrich_package_metadata(pkg))
+                    for pkg in all_packages
+                ]
+            enriched_packages = [task.result() for task in enrich_tasks]
             enrich_elapsed = time.time() - enrich_start
 
             # Log enrichment cache stats
@@ -239,11 +266,15 @@ class AnalyzePackagesUseCase:
         
         vulnerabilities_map = vuln_data.get("vulnerabilities", {})
         
-        self.logger.debug(f"Extracting vulnerabilities from map with {len(vulnerabilities_map)} entries")
+        # Per-entry debug lines are built only when debug output is on
+        debug = self.logger.is_debug_enabled()
+        if debug:
+            self.logger.debug(f"Extracting vulnerabilities from map with {len(vulnerabilities_map)} entries")
         
         # OSV returns vulnerabilities grouped by package@version
         for package_version_key, vulns_list in vulnerabilities_map.items():
-            self.logger.debug(f"Processing key: '{package_version_key}' with {len(vulns_list) if vulns_list else 0} vulns")
+            if debug:
+                self.logger.debug(f"Processing key: '{package_version_key}' with {len(vulns_list) if vulns_list else 0} vulns")
             
             # Parse package@version format
             parts = package_version_key.split("@")
@@ -252,7 +283,8 @@ class AnalyzePackagesUseCase:
                 continue
             
             package_name, version = parts[0], parts[1]
-            self.logger.debug(f"  Parsed as: package={package_name}, version={version}")
+            if debug:
+                self.logger.debug(f"  Parsed as: package={package_name}, version={version}")
             
             for vuln in vulns_list:
                 try:
@@ -290,7 +322,8 @@ class AnalyzePackagesUseCase:
                         version=ver
                     )
                     vulnerabilities.append(vulnerability)
-                    self.logger.debug(f"Found vulnerability {vuln_id} in {pkg_name}@{ver}")
+                    if debug:
+                        self.logger.debug(f"Found vulnerability {vuln_id} in {pkg_name}@{ver}")
                 except (ValueError, KeyError, TypeError) as e:
                     self.logger.debug(f"Failed to parse OSV vulnerability {vuln.get('id', 'unknown')}: {e}")
                     continue
@@ -475,36 +508,18 @@ class AnalyzePackagesUseCase:
         
         # Clean up GitHub markdown/quotes noise
         text = raw_license.lower().strip()
-        text = re.sub(r'["\\\']', '', text)  # Remove quotes and backslashes
-        text = re.sub(r'\b(new|revised|or)\b', '', text)  # Remove noise words
-        text = re.sub(r'\s+', ' ', text).strip()  # Normalize whitespace
-        
-        # License pattern mapping: (regex_pattern, spdx_identifier)
-        license_patterns = [
-            (r'\bmit\b(?!\w)', 'MIT'),
-            (r'\bbsd[- ]?3', 'BSD-3-Clause'),
-            (r'\bbsd[- ]?2', 'BSD-2-Clause'),
-            (r'\bbsd\b', 'BSD'),
-            (r'\bapache[- ]?2', 'Apache-2.0'),
-            (r'\bapache\b', 'Apache'),
-            (r'\bgpl[- ]?3', 'GPL-3.0'),
-            (r'\bgpl[- ]?2', 'GPL-2.0'),
-            (r'\bgpl\b', 'GPL'),
-            (r'\blgpl\b', 'LGPL'),
-            (r'\bmpl\b', 'MPL'),
-            (r'\bepl\b', 'EPL'),
-            (r'\b(unlicense|public\s+domain)\b', 'Public Domain'),
-            (r'\b(proprietary|all\s+rights\s+reserved)\b', 'Proprietary'),
-        ]
+        text = _QUOTES_RE.sub('', text)  # Remove quotes and backslashes
+        text = _NOISE_WORDS_RE.sub('', text)  # Remove noise words
+        text = _WS_RE.sub(' ', text).strip()  # Normalize whitespace
         
         # Try pattern matching first
-        for pattern, identifier in license_patterns:
-            if re.search(pattern, text):
+        for pattern, identifier in _SHORT_LICENSE_PATTERNS:
+            if pattern.search(text):
                 return identifier
         
         # Fallback: try to extract SPDX identifier from first line
         first_line = next((ln.strip() for ln in raw_license.splitlines() if ln.strip()), raw_license)
-        spdx_match = re.match(r'^([A-Za-z0-9.+\-]+(?:\-[0-9.]+)?)(?:\s|$)', first_line)
+        spdx_match = _SPDX_CANDIDATE_RE.match(first_line)
         if spdx_match:
             candidate = spdx_match.group(1)
             if len(candidate) <= 40:
@@ -3,7 +3,7 @@ Domain entities - Pure business objects without external dependencies.
 """
 
 from __future__ import annotations
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
@@ -91,9 +91,13 @@ class Vulnerability:
         return self.version == version
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
-    """Domain entity representing a software package."""
+    """Domain entity representing a software package.
+
+    Slotted to keep per-instance memory low on large dependency graphs. Not
+    frozen: enrichment and policy evaluation update fields in place.
+    """
     identifier: PackageIdentifier
     license: Optional[License] = None
     upload_time: Optional[datetime] = None
@@ -185,12 +189,11 @@ class DependencyGraph:
     
     def get_all_packages(self) -> List[Package]:
         """Get all packages in the entire dependency graph (deduplicated by name@version)."""
-        seen: Dict[str, Package] = {}
+        seen: Dict[Tuple[str, str], Package] = {}
+        keep_first = seen.setdefault
         for root in self.root_packages:
             for package in root.get_all_packages():
-                key = f"{package.identifier.name}@{package.identifier.version}"
-                if key not in seen:
-                    seen[key] = package
+                keep_first((package.identifier.name, package.identifier.version), package)
         return list(seen.values())
     
     def find_package(self, identifier: PackageIdentifier) -> Optional[Package]:
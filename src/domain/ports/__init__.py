@@ -125,6 +125,14 @@ class LoggerPort(ABC):
         """Log debug message."""
         pass
 
+    def is_debug_enabled(self) -> bool:
+        """Whether debug messages are emitted.
+
+        Lets hot loops skip building debug f-strings. Defaults to True so
+        implementations that do not filter by level keep logging.
+        """
+        return True
+
 
 class ClockPort(ABC):
     """Port for time operations (useful for testing)."""
@@ -12,11 +12,32 @@ from src.domain.entities import (
 )
 
 
+def _normalize_license_name(lic: str) -> str:
+    """Normalize a license name for case-insensitive comparison.
+
+    Removes hyphens, underscores, 'v' and '.0' suffixes.
+    """
+    normalized = lic.upper().replace('-', '').replace('_', '').replace('V', '')
+    # Remove .0 suffix (e.g., "3.0" -> "3")
+    return normalized.replace('.0', '')
+
+
 class PolicyEngine:
     """Pure domain service for applying business policies."""
     
     def __init__(self, policy: Policy) -> None:
         self.policy = policy
+        # Normalized license names; the same handful of names repeats
+        # across every package in a scan
+        self._normalized_licenses: Dict[str, str] = {}
+
+    def _normalize_license(self, lic: str) -> str:
+        """Memoized _normalize_license_name for this engine."""
+        normalized = self._normalized_licenses.get(lic)
+        if normalized is None:
+            normalized = _normalize_license_name(lic)
+            self._normalized_licenses[lic] = normalized
+        return normalized
     
     def filter_maintained_packages(self, packages: List[Package]) -> List[Package]:
         """Filter packages based on maintainability policy."""
@@ -64,20 +85,16 @@ class PolicyEngine:
     
     def evaluate_licenses(self, packages: List[Package]) -> List[Package]:
         """Mark packages with blocked licenses."""
-        # Normalize blocked licenses for case-insensitive comparison
-        # Remove: hyphens, underscores, 'v', and '.0' suffixes
-        def normalize_license(lic: str) -> str:
-            normalized = lic.upper().replace('-', '').replace('_', '').replace('V', '')
-            # Remove .0 suffix (e.g., "3.0" -> "3")
-            normalized = normalized.replace('.0', '')
-            return normalized
-        
-        blocked_licenses_normalized = {normalize_license(lic) for lic in self.policy.blocked_licenses}
+        blocked_licenses_normalized = frozenset(
+            self._normalize_license(lic) for lic in self.policy.blocked_licenses
+        )
+        if not blocked_licenses_normalized:
+            return packages
         
         for package in packages:
             if package.license and package.license.name:
                 # Normalize package license for comparison
-                pkg_license_normalized = normalize_license(package.license.name)
+                pkg_license_normalized = self._normalize_license(package.license.name)
                 
                 # Check if normalized license matches any blocked license
                 if pkg_license_normalized in blocked_licenses_normalized:
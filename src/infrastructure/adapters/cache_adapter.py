@@ -9,10 +9,16 @@ import time
 from typing import Any, Optional
 from pathlib import Path
 
+import orjson
+
 from src.domain.ports import CachePort, LoggerPort
 from src.infrastructure.config.settings import CacheSettings
 
 
+# Non-str dict keys are stringified, as json.dump did
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
 class CacheDiskAdapter(CachePort):
     """Disk-based cache implementation."""
     
@@ -40,8 +46,7 @@ class CacheDiskAdapter(CachePort):
                 return None
             
             # Check TTL
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+            metadata = orjson.loads(metadata_file.read_bytes())
             
             created_at = metadata.get("created_at", 0)
             if time.time() - created_at > self.ttl_seconds:
@@ -49,9 +54,8 @@ class CacheDiskAdapter(CachePort):
                 await self.delete(key)
                 return None
             
-            # Load cached value
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
+            # Load cached value (orjson decodes the raw bytes directly)
+            data = orjson.loads(cache_file.read_bytes())
             
             self.logger.debug(f"Cache hit for key: {key[:50]}...")
             return data
@@ -70,8 +74,7 @@ class CacheDiskAdapter(CachePort):
             metadata_file = self._get_metadata_file(key)
             
             # Save data
-            with open(cache_file, 'w') as f:
-                json.dump(value, f)
+            cache_file.write_bytes(orjson.dumps(value, option=_ORJSON_OPTIONS))
             
             # Save metadata
             metadata = {
@@ -79,8 +82,7 @@ class CacheDiskAdapter(CachePort):
                 "ttl_seconds": ttl_seconds or self.ttl_seconds,
                 "key": key
             }
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f)
+            metadata_file.write_bytes(orjson.dumps(metadata))
             
             self.logger.debug(f"Cache set for key: {key[:50]}...")
             
@@ -100,8 +102,7 @@ class CacheDiskAdapter(CachePort):
         
         # Check TTL
         try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+            metadata = orjson.loads(metadata_file.read_bytes())
             
             created_at = metadata.get("created_at", 0)
             ttl = metadata.get("ttl_seconds", self.ttl_seconds)
@@ -5,21 +5,56 @@ is not in the trust store, so certificate verification is disabled — same stan
 as ``pypi_info.py`` (``SSL_VERIFY = False``).
 """
 from __future__ import annotations
+from typing import Any
+
 import aiohttp
+import orjson
+
+from src import __version__
 
 # Disable TLS certificate verification (corporate intercepting proxy).
 SSL_VERIFY = False
 
+# Sent on every request. Accept-Encoding is left to aiohttp, which already
+# advertises gzip/deflate (plus br when a Brotli decoder is installed) and
+# decompresses transparently.
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": f"pypi-scanner/{__version__}",
+}
+
 
 def make_client_session(
     timeout: aiohttp.ClientTimeout | None = None,
+    *,
+    limit: int = 100,
+    limit_per_host: int = 0,
+    ttl_dns_cache: int = 10,
+    keepalive_timeout: float = 15.0,
 ) -> aiohttp.ClientSession:
     """Return a ClientSession honoring the SSL_VERIFY flag.
 
     ``ssl=False`` skips certificate validation but still uses TLS. The connector
-    is owned and closed by the session on ``async with`` exit.
+    is owned and closed by the session on ``async with`` exit (or ``close()``
+    for long-lived sessions). Pool arguments default to aiohttp's own.
     """
     return aiohttp.ClientSession(
         timeout=timeout,
-        connector=aiohttp.TCPConnector(ssl=SSL_VERIFY),
+        headers=DEFAULT_HEADERS,
+        connector=aiohttp.TCPConnector(
+            ssl=SSL_VERIFY,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=ttl_dns_cache,
+            keepalive_timeout=keepalive_timeout,
+        ),
     )
+
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a response body with orjson.
+
+    Faster than ``response.json()`` (stdlib json plus content-type sniffing)
+    on the multi-KB payloads returned by PyPI, GitHub and OSV.
+    """
+    return orjson.loads(await response.read())
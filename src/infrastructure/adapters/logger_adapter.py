@@ -56,8 +56,15 @@ class LoggerAdapter(LoggerPort):
         """Log debug message."""
         self._log(logging.DEBUG, message, kwargs)
     
+    def is_debug_enabled(self) -> bool:
+        """Whether the configured level lets debug messages through."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
     def _log(self, level: int, message: str, context: dict[str, Any]) -> None:
         """Log message with context."""
+        # Skip the context formatting below for filtered-out levels
+        if not self.logger.isEnabledFor(level):
+            return
         if self.settings.format_type == "json":
             # For JSON format, pass context as extra
             self.logger.log(level, message, extra={"context": context})
@@ -7,6 +7,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any, cast
 
+import orjson
+
 from src.domain.ports import LoggerPort
 
 
@@ -118,8 +120,7 @@ class MarkdownReportAdapter:
                 self.logger.error(f"Report file not found: {report_path}")
                 return False
 
-            with open(report_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(Path(report_path).read_bytes())
 
             packages = data.get("packages", [])
             if not packages:
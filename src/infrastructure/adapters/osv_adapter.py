@@ -13,7 +13,7 @@ import aiohttp
 
 from src.domain.ports import VulnerabilityscannerPort, LoggerPort
 from src.domain.entities import Vulnerability, SeverityLevel
-from src.infrastructure.adapters.http_session import make_client_session
+from src.infrastructure.adapters.http_session import make_client_session, read_json
 
 
 class OSVAdapter(VulnerabilityscannerPort):
@@ -123,7 +123,7 @@ class OSVAdapter(VulnerabilityscannerPort):
             try:
                 async with session.post(self.batch_url, json=payload) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await read_json(response)
                         
                         # Process results - position in results matches position in queries
                         results = data.get("results", [])
@@ -203,7 +203,7 @@ class OSVAdapter(VulnerabilityscannerPort):
         try:
             async with session.post(self.query_url, json=payload) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await read_json(response)
                     return data.get("vulns", [])
                 else:
                     self.logger.debug(
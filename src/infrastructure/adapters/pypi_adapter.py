@@ -7,16 +7,57 @@ import re
 import time
 import asyncio
 import aiohttp
-from typing import Optional, Dict, Any, List, Tuple, cast
-from typing import Any as TypingAny
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, cast
+from dataclasses import replace
 from datetime import datetime
 
-from src.domain.entities import Package, License, LicenseType
+from src.domain.entities import Package, License
 from src.domain.ports import MetadataProviderPort, LoggerPort, CachePort
 from src.domain.services.license_validator import LicenseValidator
 from src.infrastructure.config.settings import APISettings
 from src.infrastructure.utilities.retry_policy import RetryPolicy
-from src.infrastructure.adapters.http_session import make_client_session
+from src.infrastructure.utilities.async_memo import AsyncMemo
+from src.infrastructure.adapters.http_session import make_client_session, read_json
+
+
+_GITHUB_URL_PREFIXES = (
+    "https://github.com/",
+    "http://github.com/",
+    "git+https://github.com/",
+)
+_GITHUB_HOST_RE = re.compile(r"github\.com", re.IGNORECASE)
+_GITHUB_REPO_URL_RE = re.compile(r"https://github\.com/[\w\-]+/[\w\-]+")
+# project_urls labels that usually hold the repository link, probed first
+_GH_KEYS = ("Source", "Repository", "Source Code", "Homepage", "GitHub", "Code")
+# Only the head of a package description is scanned for a repo URL
+_DESCRIPTION_SCAN_LIMIT = 4096
+
+# PyPI ``info`` keys copied onto Package fields of the same name
+_STR_FIELDS = (
+    "summary",
+    "home_page",
+    "author",
+    "author_email",
+    "maintainer",
+    "maintainer_email",
+    "keywords",
+)
+_LIST_FIELDS = ("classifiers", "requires_dist")
+
+
+def _slim_pypi_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the parts of a PyPI JSON response that are read downstream.
+
+    ``releases`` (the full release history) and ``vulnerabilities`` are
+    dropped and ``urls`` is cut to its first file, which is all
+    ``_parse_upload_time`` needs, so the bulk of the payload is freed right
+    after decoding and never reaches the disk cache.
+    """
+    urls = data.get("urls")
+    return {
+        "info": data.get("info"),
+        "urls": urls[:1] if isinstance(urls, list) else [],
+    }
 
 
 class PyPIClientAdapter(MetadataProviderPort):
@@ -25,6 +66,8 @@ class PyPIClientAdapter(MetadataProviderPort):
     # Cache TTL for version-specific PyPI data (immutable once published)
     _PYPI_METADATA_TTL = 7 * 24 * 3600  # 7 days
     _GITHUB_LICENSE_TTL = 7 * 24 * 3600  # 7 days
+    # In-process memo lifetime for data that may change during a scan
+    _IN_PROCESS_TTL = 300  # 5 minutes
 
     def __init__(
         self,
@@ -40,20 +83,60 @@ class PyPIClientAdapter(MetadataProviderPort):
         self._pypi_cache_misses = 0
         self._github_cache_hits = 0
         self._github_cache_misses = 0
-        # Initialize retry policy for resilient API calls
+        # Initialize retry policy for resilient API calls. HTTP error statuses
+        # are returned rather than raised, so only transport failures and
+        # timeouts are worth retrying; anything else is a bug or bad payload
         self.retry_policy = RetryPolicy(
             max_retries=3,
             base_delay_seconds=1.0,
             max_delay_seconds=30.0,
-            logger=logger
+            logger=logger,
+            retry_on=(aiohttp.ClientError, asyncio.TimeoutError),
         )
         # GitHub rate-limit state: tracks when the limit resets (Unix timestamp)
         self._github_rate_limited_until: float = 0.0
         self._github_rate_limit_warned: bool = False
         self._github_token_invalid: bool = False
-        # Semaphore limits concurrent GitHub requests to prevent burst rate-limiting
-        self._github_semaphore = asyncio.Semaphore(5)
+        # Semaphores bound in-flight requests per API: PyPI tolerates a wide
+        # fan-out, GitHub's rate limit is far stricter
+        self._pypi_semaphore = asyncio.Semaphore(settings.pypi_concurrency)
+        self._github_semaphore = asyncio.Semaphore(settings.github_concurrency)
+        # In-process memo: duplicate (package, version) pairs and shared repos
+        # across the dependency graph resolve to a single HTTP round trip.
+        # Failed lookups come back as None and are not memoized, so they are
+        # retried. Versioned data is immutable; latest-version and GitHub data
+        # can change mid-scan, so those entries expire after _IN_PROCESS_TTL
+        self._pypi_memo: AsyncMemo[Optional[Dict[str, Any]]] = AsyncMemo(maxsize=4096)
+        self._latest_memo: AsyncMemo[Optional[Tuple[Optional[str], Optional[datetime]]]] = AsyncMemo(
+            maxsize=4096, ttl_seconds=self._IN_PROCESS_TTL
+        )
+        self._project_memo: AsyncMemo[Optional[Dict[str, Any]]] = AsyncMemo(
+            maxsize=4096, ttl_seconds=self._IN_PROCESS_TTL
+        )
+        self._github_memo: AsyncMemo[Optional[Dict[str, Any]]] = AsyncMemo(
+            maxsize=4096, ttl_seconds=self._IN_PROCESS_TTL
+        )
+        # Shared HTTP session (lazy): keeps TLS connections to PyPI and GitHub
+        # alive across requests instead of a handshake per call
+        self._session: Optional[aiohttp.ClientSession] = None
     
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = make_client_session(
+                limit=64,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     def get_cache_stats(self) -> Dict[str, int]:
         """Return current cache performance counters."""
         return {
@@ -71,71 +154,47 @@ class PyPIClientAdapter(MetadataProviderPort):
         self._github_cache_misses = 0
 
     # --- Helper normalization utilities ---------------------------------
-    def _safe_str(self, value: TypingAny) -> Optional[str]:
-        """Return a stripped string or None for non-string/empty values."""
-        if isinstance(value, str):
-            v = value.strip()
-            return v if v else None
-        return None
+    def _safe_list(self, value: Any) -> List[str]:
+        """Return a list of strings or an empty list for other types.
 
-    def _safe_list(self, value: TypingAny) -> List[str]:
-        """Return a list of strings or an empty list for other types."""
+        PyPI JSON lists are almost always already strings, so those items are
+        passed through without a ``str()`` call.
+        """
         if isinstance(value, (list, tuple)):
-            cast_list = cast(List[TypingAny], value)
-            return [str(x) for x in cast_list]
+            return [x if type(x) is str else str(x) for x in value]
         return []
 
-    def _safe_dict(self, value: TypingAny) -> Dict[str, str]:
-        """Return a dict[str,str] or empty dict for other types."""
-        if isinstance(value, dict):
-            cast_dict = cast(Dict[TypingAny, TypingAny], value)
-            return {str(k): str(v) for k, v in cast_dict.items() if v is not None}
-        return {}
+    def _safe_dict(self, value: Any) -> Dict[str, str]:
+        """Return a dict[str,str] or empty dict for other types.
 
-    def _safe_project_urls(self, info: Dict[str, Any]) -> Dict[str, str]:
-        """Normalize project_urls from package info to Dict[str, str]."""
-        raw = info.get("project_urls", {})
-        return self._safe_dict(raw)
-
-    def _normalize_spdx_license(self, license_str: str) -> str:
-        """Normalize SPDX license identifier from lowercase to proper case.
-        
-        Examples:
-            'mit' -> 'MIT'
-            'apache-2.0' -> 'Apache-2.0'
-            'bsd-3-clause' -> 'BSD-3-Clause'
-            'gpl-3.0' -> 'GPL-3.0'
+        Entries that are already str -> str (the norm for PyPI JSON) are
+        copied as-is; only the rest go through ``str()``.
         """
-        if not license_str:
-            return license_str
-        
-        # Map of lowercase SPDX to properly formatted versions
-        spdx_map = {
-            'mit': 'MIT',
-            'apache-2.0': 'Apache-2.0',
-            'bsd-3-clause': 'BSD-3-Clause',
-            'bsd-2-clause': 'BSD-2-Clause',
-            'gpl-3.0': 'GPL-3.0',
-            'gpl-2.0': 'GPL-2.0',
-            'lgpl-2.1': 'LGPL-2.1',
-            'lgpl-3.0': 'LGPL-3.0',
-            'mpl-2.0': 'MPL-2.0',
-            'isc': 'ISC',
-            'unlicense': 'Unlicense',
-        }
-        
-        lower = license_str.lower().strip()
-        return spdx_map.get(lower, license_str)
-    
+        if not isinstance(value, dict):
+            return {}
+        out: Dict[str, str] = {}
+        for k, v in value.items():
+            if v is None:
+                continue
+            if type(k) is str and type(v) is str:
+                out[k] = v
+            else:
+                out[str(k)] = str(v)
+        return out
 
-    
     async def enrich_package_metadata(self, package: Package) -> Package:
         """Enrich package with metadata from PyPI and GitHub APIs."""
-        self.logger.debug(f"Enriching package {package.identifier}")
+        debug = self.logger.is_debug_enabled()
+        if debug:
+            self.logger.debug(f"Enriching package {package.identifier}")
         
         try:
-            # Get PyPI metadata
-            pypi_data = await self._fetch_pypi_metadata(package.identifier.name, package.identifier.version)
+            # Versioned metadata and latest-version info are independent:
+            # fetch both concurrently so a package costs one RTT, not two
+            pypi_data, (latest_ver, latest_ut) = await asyncio.gather(
+                self._fetch_pypi_metadata(package.identifier.name, package.identifier.version),
+                self._fetch_latest_version_info(package.identifier.name),
+            )
             
             if not pypi_data:
                 self.logger.warning(f"No PyPI data found for {package.identifier}")
@@ -144,41 +203,33 @@ class PyPIClientAdapter(MetadataProviderPort):
             # Update package with PyPI data
             enriched_package = self._merge_pypi_data(package, pypi_data)
             
-            # Fetch latest version and its upload_time from PyPI
-            latest_ver, latest_ut = await self._fetch_latest_version_info(
-                package.identifier.name
-            )
             if latest_ver:
                 enriched_package.latest_version = latest_ver
             if latest_ut:
                 enriched_package.latest_upload_time = latest_ut
             
             # Enrich with GitHub data if available
-            if enriched_package.github_url:
-                github_data = await self._fetch_github_metadata(
-                    enriched_package.github_url
-                )
+            github_url = enriched_package.github_url
+            if github_url:
+                github_data = await self._fetch_github_metadata(github_url)
                 if github_data:
                     self._github_cache_misses += 1
                     # Cache license for fallback on future rate-limits
-                    await self._cache_github_license(
-                        enriched_package.github_url, github_data
-                    )
+                    await self._cache_github_license(github_url, github_data)
                     enriched_package = self._merge_github_data(
                         enriched_package, github_data
                     )
                 else:
                     # Fallback: cached license (no pushed_at)
-                    cached_gh = await self._get_cached_github_license(
-                        enriched_package.github_url
-                    )
+                    cached_gh = await self._get_cached_github_license(github_url)
                     if cached_gh:
                         self._github_cache_hits += 1
                         enriched_package = self._merge_github_data(
                             enriched_package, cached_gh
                         )
             
-            self.logger.debug(f"Successfully enriched {package.identifier}")
+            if debug:
+                self.logger.debug(f"Successfully enriched {package.identifier}")
             return enriched_package
             
         except Exception as e:
@@ -186,7 +237,14 @@ class PyPIClientAdapter(MetadataProviderPort):
             return package  # Return original package if enrichment fails
     
     async def _fetch_pypi_metadata(self, package_name: str, version: str) -> Optional[Dict[str, Any]]:
-        """Fetch metadata from PyPI API with cache and automatic retries.
+        """Fetch metadata from PyPI, memoized in-process per (name, version)."""
+        return await self._pypi_memo.get_or_fetch(
+            f"{package_name.lower()}@{version}",
+            lambda: self._load_pypi_metadata(package_name, version),
+        )
+
+    async def _load_pypi_metadata(self, package_name: str, version: str) -> Optional[Dict[str, Any]]:
+        """Load metadata from PyPI API with cache and automatic retries.
 
         Version-specific PyPI data is immutable once published, so results
         are cached to avoid redundant HTTP calls across scans.
@@ -205,35 +263,33 @@ class PyPIClientAdapter(MetadataProviderPort):
                     f"Cache hit for PyPI metadata: "
                     f"{package_name}@{version}"
                 )
-                return cached
+                return cast(Dict[str, Any], cached)
             self._pypi_cache_misses += 1
 
+        version_missing = False
+
         # Helper function to fetch with retry
         async def fetch_with_retry() -> Optional[Dict[str, Any]]:
-            # First, try to fetch the specific version
+            nonlocal version_missing
+            # First, try to fetch the specific version. The body is already
+            # cached under cache_key, so no validators are kept for it
             url = f"{self.settings.pypi_base_url}/{package_name}/{version}/json"
-            
-            async with make_client_session(timeout=aiohttp.ClientTimeout(total=self.settings.request_timeout)) as session:
+            async with self._pypi_semaphore:
                 try:
-                    async with session.get(url) as response:
-                        if response.status == 200:
-                            return await response.json()
-                        elif response.status == 404:
-                            # Specific version not found, try fetching latest version metadata
-                            self.logger.debug(f"Specific version {package_name}@{version} not found, trying latest")
-                            url_latest = f"{self.settings.pypi_base_url}/{package_name}/json"
-                            async with session.get(url_latest) as response_latest:
-                                if response_latest.status == 200:
-                                    return await response_latest.json()
-                                else:
-                                    self.logger.debug(f"PyPI API returned {response_latest.status} for {package_name} (may be unpublished or pre-release)")
-                                    return None
-                        else:
-                            self.logger.debug(f"PyPI API returned {response.status} for {package_name}@{version}")
-                            return None
+                    status, data, _ = await self._get_json(
+                        url, transform=_slim_pypi_payload, revalidate=False
+                    )
                 except asyncio.TimeoutError:
                     self.logger.debug(f"Timeout fetching {package_name}@{version}")
                     raise
+            if status == 404:
+                # Specific version not found: fall back to the project JSON
+                # outside the semaphore (see below)
+                self.logger.debug(f"Specific version {package_name}@{version} not found, trying latest")
+                version_missing = True
+            elif data is None:
+                self.logger.debug(f"PyPI API returned {status} for {package_name}@{version}")
+            return data
         
         # Apply retry policy
         try:
@@ -241,7 +297,10 @@ class PyPIClientAdapter(MetadataProviderPort):
         except Exception as e:
             self.logger.warning(f"Failed to fetch {package_name}@{version} after retries: {e}")
             return None
-
+        if version_missing:
+            # The latest-version lookup runs concurrently for the same
+            # project JSON; both share one memoized request
+            result = await self._fetch_project_json(package_name)
         # Store in cache (immutable per version)
         if result is not None and self._cache and cache_key:
             await self._cache.set(
@@ -263,34 +322,61 @@ class PyPIClientAdapter(MetadataProviderPort):
     async def _fetch_latest_version_info(
         self, package_name: str
     ) -> Tuple[Optional[str], Optional[datetime]]:
-        """Fetch latest version and its upload_time from PyPI."""
-        async def fetch_with_retry() -> Tuple[Optional[str], Optional[datetime]]:
-            url = f"{self.settings.pypi_base_url}/{package_name}/json"
+        """Fetch latest version and its upload_time, memoized in-process."""
+        info = await self._latest_memo.get_or_fetch(
+            package_name.lower(),
+            lambda: self._load_latest_version_info(package_name),
+        )
+        return info if info is not None else (None, None)
 
-            async with make_client_session(
-                timeout=aiohttp.ClientTimeout(total=self.settings.request_timeout)
-            ) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        version = data.get("info", {}).get("version")
-                        upload_time = self._parse_upload_time(data)
-                        return version, upload_time
-                    else:
-                        self.logger.debug(
-                            f"PyPI API returned {response.status} for "
-                            f"{package_name} (may be pre-release)"
-                        )
-                        return None, None
+    async def _load_latest_version_info(
+        self, package_name: str
+    ) -> Optional[Tuple[Optional[str], Optional[datetime]]]:
+        """Derive latest version and its upload_time from the project JSON.
+
+        Returns None when the project JSON could not be fetched.
+        """
+        data = await self._fetch_project_json(package_name)
+        if data is None:
+            return None
+        version = (data.get("info") or {}).get("version")
+        return version, self._parse_upload_time(data)
+
+    async def _fetch_project_json(self, package_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch the unversioned project JSON, memoized in-process.
+
+        Shared by the latest-version lookup and the missing-version fallback
+        of ``_load_pypi_metadata``, so a package whose pinned version is gone
+        still costs a single ``/{name}/json`` request.
+        """
+        return await self._project_memo.get_or_fetch(
+            package_name.lower(),
+            lambda: self._load_project_json(package_name),
+        )
+
+    async def _load_project_json(self, package_name: str) -> Optional[Dict[str, Any]]:
+        """Load the unversioned project JSON (latest release) from PyPI."""
+        async def fetch_with_retry() -> Optional[Dict[str, Any]]:
+            url = f"{self.settings.pypi_base_url}/{package_name}/json"
+            async with self._pypi_semaphore:
+                status, data, _ = await self._get_json(
+                    url, transform=_slim_pypi_payload
+                )
+            if data is None:
+                self.logger.debug(
+                    f"PyPI API returned {status} for "
+                    f"{package_name} (may be unpublished or pre-release)"
+                )
+            return data
 
         try:
             return await self.retry_policy.execute(fetch_with_retry)
         except Exception as e:
             self.logger.warning(
-                f"Failed to fetch latest version for {package_name} "
+                f"Failed to fetch latest metadata for {package_name} "
                 f"after retries: {e}"
             )
-            return None, None
+            return None
 
     @staticmethod
     def _parse_upload_time(pypi_data: Dict[str, Any]) -> Optional[datetime]:
@@ -300,27 +386,51 @@ class PyPIClientAdapter(MetadataProviderPort):
             ut_str = urls[0].get("upload_time")
             if ut_str:
                 try:
-                    return datetime.fromisoformat(
-                        ut_str.replace('Z', '+00:00')
-                    )
+                    # Python 3.11+ parses the trailing 'Z' natively
+                    return datetime.fromisoformat(ut_str)
                 except ValueError:
                     pass
         return None
     
     async def _fetch_github_metadata(self, github_url: str) -> Optional[Dict[str, Any]]:
         """Fetch metadata from GitHub API with authentication support and automatic retries."""
-        repo_match = re.match(r'https://github\.com/([^/]+)/([^/]+)', github_url)
-        if not repo_match:
+        repo_ref = self._parse_github_repo(github_url)
+        if repo_ref is None:
             return None
 
-        owner, repo = repo_match.groups()
-        api_url = f"{self.settings.github_base_url}/repos/{owner}/{repo}"
+        owner, repo = repo_ref
 
         # Early check to skip GitHub calls when rate limit is still active
         if time.time() < self._github_rate_limited_until:
             self.logger.debug("GitHub API rate limit active — skipping GitHub call")
             return None
 
+        return await self._github_memo.get_or_fetch(
+            f"{owner}/{repo}".lower(),
+            lambda: self._load_github_metadata(owner, repo),
+        )
+
+    @staticmethod
+    def _parse_github_repo(github_url: str) -> Optional[Tuple[str, str]]:
+        """Split a GitHub URL into (owner, repo) without a regex.
+
+        Strips a trailing ``.git`` plus any query string or fragment.
+        """
+        if not github_url.startswith(("https://github.com/", "http://github.com/")):
+            return None
+        parts = github_url.split("github.com/", 1)[1].split("/", 2)
+        if len(parts) < 2:
+            return None
+        owner = parts[0]
+        repo = parts[1].partition("#")[0].partition("?")[0].removesuffix(".git")
+        if not owner or not repo:
+            return None
+        return owner, repo
+
+    async def _load_github_metadata(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+        """Load repository metadata from GitHub API with automatic retries."""
+        api_url = f"{self.settings.github_base_url}/repos/{owner}/{repo}"
+
         async def fetch_with_retry() -> Optional[Dict[str, Any]]:
             async with self._github_semaphore:
                 # Re-check inside semaphore: another coroutine may have set the flag
@@ -335,70 +445,70 @@ class PyPIClientAdapter(MetadataProviderPort):
                 }
                 if self.settings.github_token and not self._github_token_invalid:
                     headers["Authorization"] = f"Bearer {self.settings.github_token}"
+                # Conditional requests answered with 304 do not count
+                # against the GitHub rate limit
+                status, data, response_headers = await self._get_json(
+                    api_url, headers=headers
+                )
+                if data is not None:
+                    return data
+
+                if status == 401:
+                    if not self._github_token_invalid:
+                        self._github_token_invalid = True
+                        self.logger.warning(
+                            "GitHub token is invalid or expired (401 Unauthorized). "
+                            "GitHub metadata will be skipped. "
+                            "Update GITHUB_TOKEN in .env to fix this."
+                        )
+                    return None
 
-                async with make_client_session(
-                    timeout=aiohttp.ClientTimeout(total=self.settings.request_timeout)
-                ) as session:
-                    async with session.get(api_url, headers=headers) as response:
-                        if response.status == 200:
-                            return await response.json()
-
-                        elif response.status == 401:
-                            if not self._github_token_invalid:
-                                self._github_token_invalid = True
-                                self.logger.warning(
-                                    "GitHub token is invalid or expired (401 Unauthorized). "
-                                    "GitHub metadata will be skipped. "
-                                    "Update GITHUB_TOKEN in .env to fix this."
-                                )
-                            return None
-
-                        elif response.status in (403, 429):
-                            remaining = response.headers.get("X-RateLimit-Remaining", "1")
-                            retry_after = response.headers.get("Retry-After")
-                            reset_ts = response.headers.get("X-RateLimit-Reset")
-
-                            is_rate_limit = (
-                                response.status == 429
-                                or remaining == "0"
-                                or retry_after is not None
-                            )
+                elif status in (403, 429):
+                    remaining = response_headers.get("X-RateLimit-Remaining", "1")
+                    retry_after = response_headers.get("Retry-After")
+                    reset_ts = response_headers.get("X-RateLimit-Reset")
 
-                            if is_rate_limit:
-                                # Retry-After takes precedence over X-RateLimit-Reset
-                                if retry_after:
-                                    self._github_rate_limited_until = (
-                                        time.time() + float(retry_after) + 5
-                                    )
-                                elif reset_ts:
-                                    self._github_rate_limited_until = float(reset_ts) + 5
-                                else:
-                                    self._github_rate_limited_until = time.time() + 3600
-
-                                if not self._github_rate_limit_warned:
-                                    self._github_rate_limit_warned = True
-                                    self.logger.warning(
-                                        f"GitHub API rate limit exceeded. "
-                                        f"Remaining: {remaining}, Reset at: "
-                                        f"{reset_ts or 'unknown'}. "
-                                        f"GitHub calls paused until reset."
-                                    )
-                            else:
-                                self.logger.warning(
-                                    f"GitHub API 403 Forbidden for {owner}/{repo} "
-                                    f"(not a rate limit — check token permissions)"
-                                )
-                            return None
-
-                        elif response.status == 404:
-                            self.logger.warning(f"GitHub repository not found: {owner}/{repo}")
-                            return None
+                    is_rate_limit = (
+                        status == 429
+                        or remaining == "0"
+                        or retry_after is not None
+                    )
 
+                    if is_rate_limit:
+                        # Retry-After takes precedence over X-RateLimit-Reset
+                        if retry_after:
+                            self._github_rate_limited_until = (
+                                time.time() + float(retry_after) + 5
+                            )
+                        elif reset_ts:
+                            self._github_rate_limited_until = float(reset_ts) + 5
                         else:
+                            self._github_rate_limited_until = time.time() + 3600
+
+                        if not self._github_rate_limit_warned:
+                            self._github_rate_limit_warned = True
                             self.logger.warning(
-                                f"GitHub API returned {response.status} for {owner}/{repo}"
+                                f"GitHub API rate limit exceeded. "
+                                f"Remaining: {remaining}, Reset at: "
+                                f"{reset_ts or 'unknown'}. "
+                                f"GitHub calls paused until reset."
                             )
-                            return None
+                    else:
+                        self.logger.warning(
+                            f"GitHub API 403 Forbidden for {owner}/{repo} "
+                            f"(not a rate limit — check token permissions)"
+                        )
+                    return None
+
+                elif status == 404:
+                    self.logger.warning(f"GitHub repository not found: {owner}/{repo}")
+                    return None
+
+                else:
+                    self.logger.warning(
+                        f"GitHub API returned {status} for {owner}/{repo}"
+                    )
+                    return None
 
         try:
             return await self.retry_policy.execute(fetch_with_retry)
@@ -408,6 +518,78 @@ class PyPIClientAdapter(MetadataProviderPort):
             )
             return None
 
+    async def _get_json(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        revalidate: bool = True,
+    ) -> Tuple[int, Optional[Dict[str, Any]], Mapping[str, str]]:
+        """Conditional JSON GET shared by the PyPI and GitHub fetchers.
+
+        Returns ``(status, data, response_headers)``. ``data`` is only set for
+        a 200, or for a 304 answered from the stored validators (reported as
+        200). ``transform`` slims the decoded body before it is stored.
+        ``revalidate=False`` sends a plain GET and stores no validators.
+        Callers hold the relevant semaphore and own retries.
+        """
+        validators = await self._get_http_validators(url) if revalidate else None
+        request_headers = dict(headers) if headers else {}
+        request_headers.update(self._conditional_headers(validators))
+
+        session = await self._get_session()
+        async with (
+            asyncio.timeout(self.settings.request_timeout),
+            session.get(url, headers=request_headers) as response,
+        ):
+            status = response.status
+            if status == 304 and validators:
+                return 200, cast(Dict[str, Any], validators["body"]), response.headers
+            if status != 200:
+                return status, None, response.headers
+            data: Dict[str, Any] = await read_json(response)
+            if transform is not None:
+                data = transform(data)
+            if revalidate:
+                await self._store_http_validators(url, response.headers, data)
+            return status, data, response.headers
+
+    async def _get_http_validators(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the stored ETag/Last-Modified and body for ``url``, if any."""
+        if not self._cache:
+            return None
+        cache_key = self._cache.generate_key("http_validators", url)
+        return await self._cache.get(cache_key)
+
+    async def _store_http_validators(
+        self, url: str, headers: Mapping[str, str], body: Dict[str, Any]
+    ) -> None:
+        """Persist response validators with the decoded body for conditional GETs."""
+        if not self._cache:
+            return
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        cache_key = self._cache.generate_key("http_validators", url)
+        await self._cache.set(cache_key, {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        })
+
+    @staticmethod
+    def _conditional_headers(validators: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from stored validators."""
+        if not validators:
+            return {}
+        headers: Dict[str, str] = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
     async def _cache_github_license(
         self, github_url: str, github_data: Dict[str, Any]
     ) -> None:
@@ -450,38 +632,34 @@ class PyPIClientAdapter(MetadataProviderPort):
         # Parse upload time
         upload_time = self._parse_upload_time(pypi_data)
         
-        # Extract GitHub URL from project URLs or description
-        github_url = self._extract_github_url(cast(Dict[str, Any], info))
-
-        # Normalize fields using helpers
-        classifiers = self._safe_list(info.get("classifiers", []))
-        summary_value = self._safe_str(info.get("summary"))
-        home_page_value = self._safe_str(info.get("home_page"))
-        author_value = self._safe_str(info.get("author"))
-        author_email_value = self._safe_str(info.get("author_email"))
-        maintainer_value = self._safe_str(info.get("maintainer"))
-        maintainer_email_value = self._safe_str(info.get("maintainer_email"))
-        keywords_value = self._safe_str(info.get("keywords"))
-        requires_dist_value = self._safe_list(info.get("requires_dist", []))
-        project_urls_value = self._safe_project_urls(cast(Dict[str, Any], info))
-
-        return Package(
-            identifier=package.identifier,
+        # Normalize fields in one pass: strings are stripped (empty -> None),
+        # lists coerced to list[str], project URLs to dict[str, str]
+        norm: Dict[str, Any] = {
+            field: (value.strip() or None) if isinstance(value := info.get(field), str) else None
+            for field in _STR_FIELDS
+        }
+        for field in _LIST_FIELDS:
+            norm[field] = self._safe_list(info.get(field))
+        project_urls_value = self._safe_dict(info.get("project_urls"))
+
+        # Extract GitHub URL from the already-normalized project URLs,
+        # home page, or description (not stripped: it can be a full README)
+        description = info.get("description")
+        github_url = self._extract_github_url(
+            project_urls_value,
+            norm["home_page"],
+            norm["summary"],
+            description if isinstance(description, str) else None,
+        )
+
+        # Fields not listed (latest_version, dependencies, ...) are preserved
+        return replace(
+            package,
             license=license_obj,
             upload_time=upload_time,
-            summary=summary_value,
-            home_page=home_page_value,
-            author=author_value,
-            author_email=author_email_value,
-            maintainer=maintainer_value,
-            maintainer_email=maintainer_email_value,
-            keywords=keywords_value,
-            classifiers=classifiers,
-            requires_dist=requires_dist_value,
             project_urls=project_urls_value,
             github_url=github_url,
-            latest_version=package.latest_version,  # Preserve existing latest_version
-            dependencies=package.dependencies  # Preserve existing dependencies
+            **norm,
         )
     
     def _merge_github_data(self, package: Package, github_data: Dict[str, Any]) -> Package:
@@ -501,26 +679,12 @@ class PyPIClientAdapter(MetadataProviderPort):
         # Extract last commit/push date from GitHub
         last_commit_date = self._parse_github_pushed_at(github_data)
         
-        # Return updated package with merged GitHub data
-        return Package(
-            identifier=package.identifier,
+        # Only the license and last commit date change; everything else,
+        # including dependencies, is carried over by replace()
+        return replace(
+            package,
             license=final_license,
-            upload_time=package.upload_time,
-            summary=package.summary,
-            home_page=package.home_page,
-            author=package.author,
-            author_email=package.author_email,
-            maintainer=package.maintainer,
-            maintainer_email=package.maintainer_email,
-            keywords=package.keywords,
-            classifiers=package.classifiers,
-            requires_dist=package.requires_dist,
-            project_urls=package.project_urls,
-            github_url=package.github_url,
-            latest_version=package.latest_version,
-            latest_upload_time=package.latest_upload_time,
             last_commit_date=last_commit_date or package.last_commit_date,
-            dependencies=package.dependencies
         )
 
     @staticmethod
@@ -532,141 +696,43 @@ class PyPIClientAdapter(MetadataProviderPort):
         if not pushed_at:
             return None
         try:
-            return datetime.fromisoformat(
-                pushed_at.replace("Z", "+00:00")
-            )
-        except (ValueError, AttributeError):
+            return datetime.fromisoformat(pushed_at)
+        except (ValueError, TypeError):
             return None
     
-    def _extract_github_url(self, info: Dict[str, Any]) -> Optional[str]:
-        """Extract GitHub URL from package info."""
-        # Check project URLs first
-        project_urls = info.get("project_urls") or {}
-        if not isinstance(project_urls, dict):
-            project_urls = {}
-        for key, url in project_urls.items():
-            if not isinstance(url, str):
-                continue
-            if "github.com" in url.lower():
+    def _extract_github_url(
+        self,
+        project_urls: Dict[str, str],
+        home_page: Optional[str],
+        summary: Optional[str],
+        description: Optional[str],
+    ) -> Optional[str]:
+        """Extract GitHub URL from normalized package info fields."""
+        # Check project URLs first, probing the usual repository labels by
+        # key before scanning every entry. Canonical prefixes are a plain
+        # C-level compare, anything else gets a case-insensitive search
+        # without building a lowercased copy of the URL
+        for key in _GH_KEYS:
+            url = project_urls.get(key)
+            if url and "github.com" in url:
+                return url
+        for url in project_urls.values():
+            if url.startswith(_GITHUB_URL_PREFIXES) or _GITHUB_HOST_RE.search(url):
                 return url
         
         # Check home page
-        home_page = info.get("home_page") or ""
-        if not isinstance(home_page, str):
-            home_page = ""
-        if "github.com" in home_page:
+        if home_page and "github.com" in home_page:
             return home_page
         
-        # Check summary/description
-        summary = info.get("summary", "") or ""
-        description = info.get("description", "") or ""
-        combined_text = f"{summary} {description}"
-        
-        github_pattern = r'https://github\.com/[\w\-]+/[\w\-]+'
-        github_urls = re.findall(github_pattern, combined_text)
-        
-        if github_urls:
-            return min(github_urls, key=len)  # Return shortest URL (likely the main one)
+        # Check summary, then the head of the description (badges and the
+        # opening paragraph carry the repo link; READMEs can be tens of KB).
+        # A plain substring test skips the regex when there is no GitHub link
+        if description:
+            description = description[:_DESCRIPTION_SCAN_LIMIT]
+        for text in (summary, description):
+            if text and "https://github.com/" in text:
+                match = _GITHUB_REPO_URL_RE.search(text)
+                if match:
+                    return match.group(0)
         
         return None
-    
-    def _parse_license_type(self, license_name: str) -> Optional[LicenseType]:
-        """Parse license type from license name, handling full text and various formats."""
-        if not license_name:
-            return None
-        
-        # Extract short name if it's full license text
-        if len(license_name) > 100:
-            license_name = self._extract_license_name_from_text(license_name)
-        
-        license_lower = license_name.lower()
-        
-        # Check for common SPDX identifiers and variations
-        if "mit" in license_lower:
-            return LicenseType.MIT
-        elif "apache" in license_lower:
-            return LicenseType.APACHE_2_0
-        elif "bsd" in license_lower:
-            # Check for specific BSD versions
-            if "3" in license_lower or "3-clause" in license_lower:
-                return LicenseType.BSD_3_CLAUSE
-            return LicenseType.BSD_3_CLAUSE  # Default to 3-Clause
-        elif ("gpl" in license_lower or "gnu" in license_lower) and ("3" in license_lower or "v3" in license_lower):
-            return LicenseType.GPL_3_0
-        elif "lgpl" in license_lower or ("lesser" in license_lower and "gpl" in license_lower):
-            return LicenseType.LGPL_2_1
-        elif "mpl" in license_lower or "mozilla" in license_lower:
-            return LicenseType.MPL_2_0
-        elif "isc" in license_lower:
-            return LicenseType.UNKNOWN  # ISC not in enum, but valid license
-        elif "unlicense" in license_lower or "public domain" in license_lower:
-            return LicenseType.UNKNOWN
-        else:
-            return LicenseType.UNKNOWN
-    
-    def _extract_license_name_from_text(self, license_text: str) -> str:
-        """Extract license name from full license text or short name."""
-        if not license_text or len(license_text) < 5:
-            return license_text
-        
-        # Normalize line endings
-        license_text_normalized = license_text.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Extract first line (usually the license name in full text)
-        lines = license_text_normalized.split('\n')
-        first_line = lines[0].strip()
-        
-        # If first line is empty, try to find a better line
-        if not first_line or len(first_line) < 3:
-            for line in lines:
-                line = line.strip()
-                if line and len(line) > 3 and not line.startswith('Copyright') and not line.startswith('License:'):
-                    first_line = line
-                    break
-        
-        # If still no valid line, try to find one with "License" keyword
-        if not first_line or len(first_line) < 3:
-            for line in lines:
-                line = line.strip()
-                if 'license' in line.lower():
-                    first_line = line
-                    break
-        
-        if not first_line:
-            # If completely empty, return normalized stripped version (short text case)
-            return license_text_normalized.strip()
-        
-        # If the extracted first line is short (< 50 chars) and it's the only substantive line,
-        # it's likely just a name - return it as-is
-        if len(first_line) < 50 and len(lines) > 1 and not lines[1].strip():
-            # First line is short and followed by empty line - it's a name
-            return first_line
-        
-        # If the entire normalized text is short (< 50 chars), it's already a name
-        if len(license_text_normalized) < 50:
-            return license_text_normalized.strip()
-        
-        # Common patterns for license names at start of text
-        license_patterns = [
-            # Match license name ending with "License", "License v1", or "v1"
-            r"^([A-Za-z0-9\-\.\s]+?(?:License|v\d+))(?:\s|$)",
-            # Match version patterns like "2.0", "3.0", "3-Clause"
-            r"^([A-Za-z0-9\-\.\s]+?(?:2\.0|3\.0|3-Clause))(?:\s|$)",
-            # Match v-style versions like "GPL v3"
-            r"^([A-Za-z\s\-]+v?\d+)(?:\s|$)",
-            # Fallback: take the whole first line if it's reasonably short
-            r"^([A-Za-z0-9\s\-\.\(\)]+?)$",
-        ]
-        
-        for pattern in license_patterns:
-            match = re.match(pattern, first_line, re.IGNORECASE)
-            if match:
-                license_name = match.group(1).strip()
-                if license_name and len(license_name) > 2:
-                    return license_name
-        
-        # Final fallback: return first line if it's not too long
-        if first_line and len(first_line) < 100:
-            return first_line
-        
-        return license_text_normalized.strip()
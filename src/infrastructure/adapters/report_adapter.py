@@ -3,17 +3,22 @@ Report Sink Adapter - Implements ReportSinkPort for saving reports to disk.
 """
 
 from __future__ import annotations
-import json
+import asyncio
 import os
 from typing import Optional, Any
 from dataclasses import is_dataclass, asdict
 
+import orjson
+
 from src.domain.entities import AnalysisResult, Package
 from src.domain.ports import ReportSinkPort, LoggerPort
 from src.infrastructure.config.settings import ReportSettings
 from src.application.dtos import ReportDTO
 from src.infrastructure.adapters.report_merge import merge_report
 
+# Two-space indented output, matching the layout of the existing master report.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 class FileReportSinkAdapter(ReportSinkPort):
     """File system report sink implementation."""
@@ -22,56 +27,61 @@ class FileReportSinkAdapter(ReportSinkPort):
         self.settings = settings
         self.logger = logger
     
-    async def save_report(self, result, format_type: str = "json") -> str:
+    async def save_report(self, result: Any, format_type: str = "json") -> str:
         """Save analysis result or report DTO to file system.
 
         Accepts either a domain AnalysisResult or an application ReportDTO/dataclass.
         This makes the adapter tolerant to both eventualities in the call chain.
         """
-        output_path = self.settings.output_path
-        
         try:
-            # Support both domain AnalysisResult and dataclass ReportDTO
-            if isinstance(result, ReportDTO):
-                # Convert ReportDTO to plain dict
-                report_data = asdict(result)
-            elif isinstance(result, AnalysisResult):
-                # Use existing converter for domain AnalysisResult
-                report_data = self._convert_to_dict(result)
-            else:
-                # Fallback for other dataclasses
-                report_data = self._convert_to_dict(result)
-
-            # Upsert into the master report: the consolidated JSON is the single
-            # source of truth, so merge with any existing file (accumulating
-            # packages and preserving manual approvals) instead of overwriting.
-            if format_type.lower() == "json":
-                existing = self._load_existing(output_path)
-                report_data = merge_report(existing, report_data)
-
-            # Save to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if format_type.lower() == "json":
-                    json.dump(report_data, f, indent=2, ensure_ascii=False)
-                else:
-                    f.write(str(report_data))
-
-            self.logger.info(f"Report saved to {output_path}")
-            return os.path.abspath(output_path)
-            
+            # Conversion, merge and the encode/write are CPU and blocking disk
+            # work; run them off the event loop
+            return await asyncio.to_thread(self._save_sync, result, format_type)
         except Exception as e:
             self.logger.error(f"Failed to save report: {e}")
             raise
 
+    def _save_sync(self, result: Any, format_type: str) -> str:
+        """Synchronous body of save_report; runs in a worker thread."""
+        output_path = self.settings.output_path
+
+        # Support both domain AnalysisResult and dataclass ReportDTO
+        if isinstance(result, ReportDTO):
+            # Convert ReportDTO to plain dict
+            report_data = asdict(result)
+        elif isinstance(result, AnalysisResult):
+            # Use existing converter for domain AnalysisResult
+            report_data = self._convert_to_dict(result)
+        else:
+            # Fallback for other dataclasses
+            report_data = self._convert_to_dict(result)
+
+        # Upsert into the master report: the consolidated JSON is the single
+        # source of truth, so merge with any existing file (accumulating
+        # packages and preserving manual approvals) instead of overwriting.
+        if format_type.lower() == "json":
+            existing = self._load_existing(output_path)
+            report_data = merge_report(existing, report_data)
+
+        # Save to file (orjson emits UTF-8 bytes directly)
+        if format_type.lower() == "json":
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(report_data, option=_JSON_OPTIONS))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(str(report_data))
+
+        self.logger.info(f"Report saved to {output_path}")
+        return os.path.abspath(output_path)
+
     def _load_existing(self, output_path: str) -> Optional[dict[str, Any]]:
         """Load the existing master report if present, else None."""
         if not os.path.exists(output_path):
             return None
         try:
-            with open(output_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json_file(output_path)
             return data if isinstance(data, dict) else None
-        except (json.JSONDecodeError, OSError) as e:
+        except (orjson.JSONDecodeError, OSError) as e:
             self.logger.warning(
                 f"Could not read existing report at {output_path}, "
                 f"starting fresh: {e}"
@@ -81,8 +91,7 @@ class FileReportSinkAdapter(ReportSinkPort):
     async def load_report(self, location: str) -> Optional[AnalysisResult]:
         """Load analysis result from file system."""
         try:
-            with open(location, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = await asyncio.to_thread(self._read_json_file, location)
             
             # This would require implementing conversion back to domain entities
             # For now, just log that it would be loaded
@@ -93,6 +102,12 @@ class FileReportSinkAdapter(ReportSinkPort):
             self.logger.warning(f"Failed to load report from {location}: {e}")
             return None
 
+    @staticmethod
+    def _read_json_file(location: str) -> Any:
+        """Read and decode a JSON file (blocking; called via to_thread)."""
+        with open(location, 'rb') as f:
+            return orjson.loads(f.read())
+
     def _convert_to_dict(self, result: AnalysisResult) -> dict[str, Any]:
         """Convert AnalysisResult to dictionary for serialization."""
         # Convert vulnerabilities
@@ -111,12 +126,20 @@ class FileReportSinkAdapter(ReportSinkPort):
                 vuln_dict["license"] = vuln.license.name
             vulnerabilities.append(vuln_dict)
         
-        # Convert packages
-        all_packages = result.get_all_packages()
-        packages = [self._package_to_dict(pkg) for pkg in all_packages]
-        
-        # Convert maintained packages
-        filtered_packages = [self._package_to_dict(pkg) for pkg in result.maintained_packages]
+        # Convert packages. Maintained packages are usually a subset of the
+        # graph, so each Package object is converted once and the same row
+        # dict is shared by both lists (merge_report copies rows, never
+        # mutates them).
+        converted: dict[int, dict[str, Any]] = {}
+
+        def to_row(pkg: Package) -> dict[str, Any]:
+            row = converted.get(id(pkg))
+            if row is None:
+                row = converted[id(pkg)] = self._package_to_dict(pkg)
+            return row
+
+        packages = [to_row(pkg) for pkg in result.get_all_packages()]
+        filtered_packages = [to_row(pkg) for pkg in result.maintained_packages]
         
         return {
             "timestamp": result.timestamp.isoformat(),
@@ -127,11 +150,14 @@ class FileReportSinkAdapter(ReportSinkPort):
     
     def _package_to_dict(self, package: Package) -> dict[str, Any]:
         """Convert Package to dictionary."""
+        ident = package.identifier
+        lic = package.license
+        upload_time = package.upload_time
         return {
-            "package": package.identifier.name,
-            "version": package.identifier.version,
-            "license": package.license.name if package.license else None,
-            "upload_time": package.upload_time.isoformat() if package.upload_time else None,
+            "package": ident.name,
+            "version": ident.version,
+            "license": lic.name if lic is not None else None,
+            "upload_time": upload_time.isoformat() if upload_time is not None else None,
             "summary": package.summary,
             "home_page": package.home_page,
             "author": package.author,
@@ -143,5 +169,5 @@ class FileReportSinkAdapter(ReportSinkPort):
             "requires_dist": package.requires_dist,
             "project_urls": package.project_urls,
             "dependencies": [str(dep) for dep in package.dependencies],
-            "license_rejected": package.license.is_rejected if package.license else False
-        }
\ No newline at end of file
+            "license_rejected": lic.is_rejected if lic is not None else False
+        }
@@ -7,6 +7,7 @@ No external Python package required — only the ``uv`` binary on PATH.
 
 from __future__ import annotations
 import asyncio
+import functools
 import hashlib
 import os
 import re
@@ -14,7 +15,7 @@ import shutil
 import subprocess
 import sys
 import time
-from typing import List, Dict, Any, Optional, cast
+from typing import Any, Dict, Iterator, List, Optional
 
 import aiohttp
 
@@ -22,7 +23,7 @@ from src.domain.entities import DependencyGraph
 from src.domain.ports import DependencyResolverPort, LoggerPort, CachePort
 from src.infrastructure.config.settings import APISettings
 from src.domain.services import GraphBuilder
-from src.infrastructure.adapters.http_session import make_client_session
+from src.infrastructure.adapters.http_session import make_client_session, read_json
 
 
 def _resolve_uv_bin() -> Optional[str]:
@@ -78,6 +79,9 @@ class UvDepResolverAdapter(DependencyResolverPort):
         self.cache = cache
         self.graph_builder = GraphBuilder()
         self.api_settings = api_settings or APISettings()
+        # A single uv process can keep several cores busy; bound how many
+        # run at once instead of spawning one per requested package
+        self._uv_semaphore = asyncio.Semaphore(self.api_settings.uv_concurrency)
 
         # Grab version for logging
         version = self._get_uv_version()
@@ -149,56 +153,35 @@ class UvDepResolverAdapter(DependencyResolverPort):
     async def _run_uv_resolver(
         self, packages: List[str]
     ) -> Dict[str, Any]:
-        """Resolve each package in parallel via ``uv pip compile``."""
+        """Resolve packages via ``uv pip compile``.
+
+        Each spec is compiled on its own (bounded by the uv semaphore), so a
+        package's tree and its cache entry never depend on which other
+        packages were scanned alongside it.
+        """
         start_time = time.time()
         self.logger.debug(
-            f"Resolving {len(packages)} packages in parallel with UV"
+            f"Resolving {len(packages)} packages with UV"
         )
 
-        tasks = [
-            self._resolve_single_package(pkg) for pkg in packages
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        cached = await asyncio.gather(
+            *(self.cache.get(self._cache_key(pkg)) for pkg in packages)
+        )
+        # Each package carries its own PyPI fallback, so a failed compile
+        # falls back while the other packages are still resolving
+        results = await asyncio.gather(*(
+            self._resolve_with_fallback(pkg, cached=hit)
+            for pkg, hit in zip(packages, cached)
+        ))
 
         all_dependencies: List[Dict[str, Any]] = []
         cache_hits = 0
         cache_misses = 0
 
-        for i, result in enumerate(results):
-            package = packages[i]
-
-            if isinstance(result, Exception):
-                self.logger.warning(
-                    f"Failed to resolve package {package}: {result}"
-                )
-                parts = package.split("==", 1)
-                pkg_name = parts[0]
-                pkg_version = parts[1] if len(parts) == 2 else "unknown"
-
-                fallback_deps = await self._fetch_dependencies_from_pypi(
-                    pkg_name, pkg_version
-                )
-                if fallback_deps:
-                    self.logger.info(
-                        f"PyPI fallback resolved {len(fallback_deps)} "
-                        f"dependencies for {package}"
-                    )
-                else:
-                    self.logger.warning(
-                        f"PyPI fallback found no dependencies for {package}"
-                    )
-                all_dependencies.append({
-                    "name": pkg_name,
-                    "version": pkg_version,
-                    "dependencies": fallback_deps,
-                })
-                continue
-
-            # result is (dependency_entry, from_cache)
-            dependency_entry, from_cache = result
-            if from_cache:
+        for dependency_entry, from_cache in results:
+            if from_cache is True:
                 cache_hits += 1
-            else:
+            elif from_cache is False:
                 cache_misses += 1
             all_dependencies.append(dependency_entry)
 
@@ -209,25 +192,71 @@ class UvDepResolverAdapter(DependencyResolverPort):
         )
         return {"dependencies": all_dependencies}
 
+    async def _resolve_with_fallback(
+        self,
+        package: str,
+        cached: Optional[Dict[str, Any]] = None,
+    ) -> tuple[Dict[str, Any], Optional[bool]]:
+        """
+        Resolve *package* with uv, falling back to PyPI metadata on failure.
+
+        Returns:
+            Tuple of (dependency_entry, from_cache); from_cache is None when
+            the entry came from the PyPI fallback.
+        """
+        try:
+            return await self._resolve_single_package(package, cached=cached)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to resolve package {package}: {e}"
+            )
+
+        parts = package.split("==", 1)
+        pkg_name = parts[0]
+        pkg_version = parts[1] if len(parts) == 2 else "unknown"
+
+        fallback_deps = await self._fetch_dependencies_from_pypi(
+            pkg_name, pkg_version
+        )
+        if fallback_deps:
+            self.logger.info(
+                f"PyPI fallback resolved {len(fallback_deps)} "
+                f"dependencies for {package}"
+            )
+        else:
+            self.logger.warning(
+                f"PyPI fallback found no dependencies for {package}"
+            )
+        return {
+            "name": pkg_name,
+            "version": pkg_version,
+            "dependencies": fallback_deps,
+        }, None
+
     async def _resolve_single_package(
-        self, package: str
+        self,
+        package: str,
+        cached: Optional[Dict[str, Any]] = None,
     ) -> tuple[Dict[str, Any], bool]:
         """
-        Resolve a single package, checking the cache first.
+        Resolve a single package from the cache or uv.
+
+        Args:
+            package: Package spec.
+            cached: Cache entry already looked up by the caller, if any.
 
         Returns:
             Tuple of (dependency_entry, from_cache).
         """
-        cache_key = self._cache_key(package)
-        cached = await self.cache.get(cache_key)
         if cached is not None:
             self.logger.debug(f"Cache hit for {package}")
-            return cast(Dict[str, Any], cached), True
+            return cached, True
 
         self.logger.debug(f"Cache miss for {package} — running uv")
-        entry = await self._compile_with_uv(package)
+        async with self._uv_semaphore:
+            entry = await self._compile_with_uv(package)
 
-        await self.cache.set(cache_key, entry, ttl_seconds=3600)
+        await self.cache.set(self._cache_key(package), entry, ttl_seconds=3600)
         return entry, False
 
     async def _compile_with_uv(
@@ -243,34 +272,8 @@ class UvDepResolverAdapter(DependencyResolverPort):
         Returns:
             Dict ``{"name", "version", "dependencies": [...]}``.
         """
-        cmd = [
-            _UV_BIN, "pip", "compile",
-            "--no-header",
-            "--annotation-style=line",
-            "--quiet",
-        ]
-
-        if self.api_settings.uv_allow_prerelease:
-            cmd.append("--prerelease=allow")
-
-        # Add private index when configured
-        if self.api_settings.private_index_url and self.api_settings.private_index_pat:
-            url = self.api_settings.private_index_url.rstrip("/")
-            pat = self.api_settings.private_index_pat
-            # Embed PAT as password in the URL (Azure DevOps accepts any username)
-            if "://" in url:
-                scheme, rest = url.split("://", 1)
-                url_with_creds = f"{scheme}://VssSessionToken:{pat}@{rest}"
-            else:
-                url_with_creds = url
-            cmd += ["--extra-index-url", url_with_creds]
-        elif self.api_settings.private_index_url:
-            cmd += ["--extra-index-url", self.api_settings.private_index_url]
-
-        cmd.append("-")
-
         proc = await asyncio.create_subprocess_exec(
-            *cmd,
+            *self._compile_cmd,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
@@ -296,6 +299,39 @@ class UvDepResolverAdapter(DependencyResolverPort):
 
         return self._parse_compile_output(package, stdout.decode())
 
+    @functools.cached_property
+    def _compile_cmd(self) -> tuple[str, ...]:
+        """``uv pip compile`` argv, built once per adapter.
+
+        Depends only on the (frozen) API settings; specs go in via stdin.
+        """
+        cmd = [
+            _UV_BIN or "uv", "pip", "compile",
+            "--no-header",
+            "--annotation-style=line",
+            "--quiet",
+        ]
+
+        if self.api_settings.uv_allow_prerelease:
+            cmd.append("--prerelease=allow")
+
+        # Add private index when configured
+        if self.api_settings.private_index_url and self.api_settings.private_index_pat:
+            url = self.api_settings.private_index_url.rstrip("/")
+            pat = self.api_settings.private_index_pat
+            # Embed PAT as password in the URL (Azure DevOps accepts any username)
+            if "://" in url:
+                scheme, rest = url.split("://", 1)
+                url_with_creds = f"{scheme}://VssSessionToken:{pat}@{rest}"
+            else:
+                url_with_creds = url
+            cmd += ["--extra-index-url", url_with_creds]
+        elif self.api_settings.private_index_url:
+            cmd += ["--extra-index-url", self.api_settings.private_index_url]
+
+        cmd.append("-")
+        return tuple(cmd)
+
     # ── Output parsing ───────────────────────────────────────────────
 
     def _parse_compile_output(
@@ -312,10 +348,29 @@ class UvDepResolverAdapter(DependencyResolverPort):
             requests==2.31.0
             urllib3==2.2.0       # via requests
         """
-        # 1. Parse all resolved packages and their "via" parents
+        packages, children_of = self._parse_compile_graph(output)
+        return self._build_tree(requested, packages, children_of)
+
+    def _parse_compile_graph(
+        self, output: str
+    ) -> tuple[Dict[str, str], Dict[str, List[str]]]:
+        """
+        Parse compile output into resolved versions and "via" edges.
+
+        Returns:
+            Tuple of (normalised name → version, parent → [child, ...]).
+        """
         packages: Dict[str, str] = {}          # normalised name → version
         children_of: Dict[str, List[str]] = {} # parent → [child, ...]
 
+        def _add_parents(via_raw: str, child: str) -> None:
+            # A package required by several others is annotated
+            # "# via a, b"
+            for raw_parent in via_raw.split(","):
+                parent = self._normalise(raw_parent)
+                if parent and parent not in ("-r", "-", "stdin", "-r -"):
+                    children_of.setdefault(parent, []).append(child)
+
         current_pkg: Optional[str] = None
 
         for raw_line in output.splitlines():
@@ -326,9 +381,7 @@ class UvDepResolverAdapter(DependencyResolverPort):
             # "# via <parent>" annotation (may appear on its own line)
             via_match = re.match(r"^#\s*via\s+(.+)$", line)
             if via_match and current_pkg:
-                parent = self._normalise(via_match.group(1).strip())
-                if parent not in ("-r", "-", "stdin", "-r -"):
-                    children_of.setdefault(parent, []).append(current_pkg)
+                _add_parents(via_match.group(1), current_pkg)
                 continue
 
             # Inline annotation: "pkg==ver   # via parent"
@@ -344,36 +397,50 @@ class UvDepResolverAdapter(DependencyResolverPort):
 
                 via_raw = (inline_match.group(3) or "").strip()
                 if via_raw:
-                    parent = self._normalise(via_raw)
-                    if parent not in ("-r", "-", "stdin", "-r -"):
-                        children_of.setdefault(parent, []).append(name)
+                    _add_parents(via_raw, name)
                 continue
 
-        # 2. Identify the root package
-        req_name = self._normalise(requested.split("==")[0])
-        req_version = packages.get(
-            req_name,
-            requested.split("==")[1]
-            if "==" in requested
-            else "unknown",
-        )
+        return packages, children_of
+
+    def _build_tree(
+        self,
+        requested: str,
+        packages: Dict[str, str],
+        children_of: Dict[str, List[str]],
+    ) -> Dict[str, Any]:
+        """
+        Build the dependency tree rooted at the *requested* spec.
 
-        # 3. Build tree recursively
-        visited: set[str] = set()
+        Depth-first with an explicit stack (no recursion limit, no frame per
+        node). Each package appears once, under the first parent that
+        reaches it in sorted pre-order.
+        """
+        req_name = self._normalise(requested.split("==")[0])
 
-        def _build(name: str) -> Dict[str, Any]:
-            visited.add(name)
-            deps: List[Dict[str, Any]] = []
-            for child in sorted(children_of.get(name, [])):
-                if child not in visited:
-                    deps.append(_build(child))
+        def _node(name: str) -> Dict[str, Any]:
             return {
                 "name": name,
                 "version": packages.get(name, "unknown"),
-                "dependencies": deps,
+                "dependencies": [],
             }
 
-        return _build(req_name)
+        root = _node(req_name)
+        visited: set[str] = {req_name}
+        stack: List[tuple[Dict[str, Any], Iterator[str]]] = [
+            (root, iter(sorted(children_of.get(req_name, []))))
+        ]
+        while stack:
+            parent, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+            elif child not in visited:
+                visited.add(child)
+                node = _node(child)
+                parent["dependencies"].append(node)
+                stack.append((node, iter(sorted(children_of.get(child, [])))))
+
+        return root
 
     @staticmethod
     def _normalise(name: str) -> str:
@@ -454,7 +521,7 @@ class UvDepResolverAdapter(DependencyResolverPort):
             async with make_client_session(timeout=timeout) as session:
                 async with session.get(url) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = await read_json(resp)
                         return data.get("info", {}).get("version")
         except Exception as exc:
             self.logger.debug(
@@ -471,7 +538,7 @@ class UvDepResolverAdapter(DependencyResolverPort):
         timeout = aiohttp.ClientTimeout(
             total=self.api_settings.request_timeout
         )
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with make_client_session(timeout=timeout) as session:
             for url in (
                 f"{base_url}/{package_name}/{version}/json",
                 f"{base_url}/{package_name}/json",
@@ -479,7 +546,7 @@ class UvDepResolverAdapter(DependencyResolverPort):
                 try:
                     async with session.get(url) as resp:
                         if resp.status == 200:
-                            data = await resp.json()
+                            data = await read_json(resp)
                             info = data.get("info", {})
                             requires = info.get("requires_dist")
                             if isinstance(requires, list) and requires:
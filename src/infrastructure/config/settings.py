@@ -9,8 +9,16 @@ from typing import Optional, List
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "on"})
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean flag; unset keeps ``default``, 1/true/yes/on enable it."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUE_STRINGS
 
 
 @dataclass(frozen=True)
@@ -24,7 +32,7 @@ class CacheSettings:
     def from_env(cls) -> CacheSettings:
         """Create CacheSettings from environment variables."""
         return cls(
-            enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
+            enabled=_env_bool("CACHE_ENABLED", True),
             directory=os.getenv("CACHE_DIRECTORY", ".cache"),
             ttl_hours=int(os.getenv("CACHE_TTL_HOURS", "24"))
         )
@@ -54,6 +62,11 @@ class PolicySettings:
         )
 
 
+def _default_uv_concurrency() -> int:
+    """Parallel ``uv pip compile`` processes: a quarter of the cores, at least 2."""
+    return max(2, (os.cpu_count() or 4) // 4)
+
+
 @dataclass(frozen=True)
 class APISettings:
     """External API configuration."""
@@ -64,6 +77,9 @@ class APISettings:
     private_index_url: Optional[str] = None
     private_index_pat: Optional[str] = None
     uv_allow_prerelease: bool = False
+    pypi_concurrency: int = 16
+    github_concurrency: int = 5
+    uv_concurrency: int = field(default_factory=_default_uv_concurrency)
 
     @classmethod
     def from_env(cls) -> APISettings:
@@ -75,9 +91,12 @@ class APISettings:
             request_timeout=int(os.getenv("API_REQUEST_TIMEOUT", "10")),
             private_index_url=os.getenv("PRIVATE_INDEX_URL"),
             private_index_pat=os.getenv("PRIVATE_INDEX_PAT"),
-            uv_allow_prerelease=os.getenv(
-                "UV_ALLOW_PRERELEASE", "false"
-            ).strip().lower() in ("1", "true", "yes", "on"),
+            uv_allow_prerelease=_env_bool("UV_ALLOW_PRERELEASE", False),
+            pypi_concurrency=int(os.getenv("PYPI_CONCURRENCY", "16")),
+            github_concurrency=int(os.getenv("GITHUB_CONCURRENCY", "5")),
+            uv_concurrency=int(
+                os.getenv("UV_CONCURRENCY") or _default_uv_concurrency()
+            ),
         )
 
 
@@ -135,9 +154,10 @@ _settings: Optional[Settings] = None
 
 
 def get_settings() -> Settings:
-    """Get the global settings instance."""
+    """Get the global settings instance, loading ``.env`` on first use."""
     global _settings
     if _settings is None:
+        load_dotenv()
         _settings = Settings.from_env()
     return _settings
 
@@ -115,6 +115,12 @@ class DependencyContainer:
             )
         return self._report_sink
     
+    async def aclose(self) -> None:
+        """Close async resources (shared HTTP sessions), then clean up."""
+        if isinstance(self._metadata_provider, PyPIClientAdapter):
+            await self._metadata_provider.aclose()
+        self.close()
+
     def close(self) -> None:
         """Clean up resources if needed."""
         # Close connections, flush caches, etc.
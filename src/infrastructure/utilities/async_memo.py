@@ -0,0 +1,71 @@
+"""
+Async Memo Utilities - In-process memoization for async lookups.
+
+Coalesces concurrent requests for the same key into a single in-flight task
+and keeps completed results in a bounded LRU with an optional TTL.
+"""
+
+from __future__ import annotations
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class AsyncMemo(Generic[T]):
+    """Bounded LRU/TTL memo for async fetchers.
+
+    Concurrent callers asking for the same key share one task, so a repeated
+    ``(package, version)`` or GitHub repo triggers a single HTTP round trip.
+    Failed fetches are evicted so that the next caller retries. A ``None``
+    result counts as a failure: the adapters' fetchers log errors and return
+    ``None`` instead of raising, and a timeout must not stick for the run.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl_seconds: Optional[float] = None):
+        """
+        Initialize memo.
+
+        Args:
+            maxsize: Maximum number of entries kept (least recently used evicted)
+            ttl_seconds: Optional lifetime of an entry; None keeps it for the run
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, asyncio.Future[T]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every memoized entry."""
+        self._entries.clear()
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return the memoized result for ``key``, running ``fetch`` on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, future = entry
+            if expires_at and time.monotonic() >= expires_at:
+                del self._entries[key]
+            else:
+                self._entries.move_to_end(key)
+                return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(fetch())
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        self._entries[key] = (expires_at, future)
+        future.add_done_callback(lambda f: self._evict_unusable(key, f))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+        return await asyncio.shield(future)
+
+    def _evict_unusable(self, key: str, future: "asyncio.Future[T]") -> None:
+        """Forget a failed, cancelled or empty fetch so later callers retry it."""
+        if future.cancelled() or future.exception() is not None or future.result() is None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is future:
+                del self._entries[key]
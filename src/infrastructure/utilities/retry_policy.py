@@ -7,7 +7,7 @@ Provides resilient HTTP request handling with configurable retry logic.
 from __future__ import annotations
 import asyncio
 import random
-from typing import TypeVar, Callable, Awaitable, Optional, Type
+from typing import TypeVar, Callable, Awaitable, Optional, Tuple, Type
 from src.domain.ports import LoggerPort
 
 T = TypeVar('T')
@@ -21,7 +21,9 @@ class RetryPolicy:
         max_retries: int = 3,
         base_delay_seconds: float = 1.0,
         max_delay_seconds: float = 30.0,
-        logger: Optional[LoggerPort] = None
+        logger: Optional[LoggerPort] = None,
+        retry_on: Tuple[Type[Exception], ...] = (Exception,),
+        give_up: Optional[Callable[[Exception], bool]] = None
     ):
         """
         Initialize retry policy.
@@ -31,11 +33,17 @@ class RetryPolicy:
             base_delay_seconds: Base delay in seconds for exponential backoff
             max_delay_seconds: Maximum delay between retries
             logger: Optional logger for debug output
+            retry_on: Exception types worth retrying; anything else propagates
+                on the first failure without backoff
+            give_up: Optional predicate; returning True for a caught exception
+                re-raises it immediately instead of retrying
         """
         self.max_retries = max_retries
         self.base_delay_seconds = base_delay_seconds
         self.max_delay_seconds = max_delay_seconds
         self.logger = logger
+        self.retry_on = retry_on
+        self.give_up = give_up
     
     async def execute(
         self,
@@ -47,6 +55,8 @@ class RetryPolicy:
         Execute async function with retry policy.
         
         Retries up to max_retries times with exponential backoff + random jitter.
+        Only exceptions matching ``retry_on`` (and not rejected by ``give_up``)
+        are retried.
         
         Args:
             func: Async function to execute
@@ -70,9 +80,13 @@ class RetryPolicy:
                 
                 return result
                 
-            except Exception as e:
+            except self.retry_on as e:
                 last_exception = e
                 
+                # Fatal errors skip the backoff entirely
+                if self.give_up is not None and self.give_up(e):
+                    raise
+                
                 # Don't retry on the last attempt
                 if attempt >= self.max_retries:
                     if self.logger:
@@ -110,14 +124,8 @@ class RetryPolicy:
         Returns:
             Delay in seconds
         """
-        # Exponential backoff: 2^attempt
-        exponential_delay = self.base_delay_seconds * (2 ** attempt)
-        
-        # Add random jitter (0 to 1 second)
-        jitter = random.uniform(0, 1.0)
-        
-        # Total delay with jitter
-        total_delay = exponential_delay + jitter
+        # Exponential backoff (2^attempt as a shift) plus 0-1s of random jitter
+        total_delay = self.base_delay_seconds * (1 << attempt) + random.random()
         
         # Cap at max_delay
         return min(total_delay, self.max_delay_seconds)
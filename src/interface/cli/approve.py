@@ -10,12 +10,13 @@ Usage::
     pyscan approve flask==2.0.0 django==4.2 --motivo "Revisado por seguridad" --por "ana"
 """
 from __future__ import annotations
-import json
 import sys
 from datetime import date
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+import orjson
+
 
 class ApprovalError(Exception):
     """Raised when a manual approval cannot be applied."""
@@ -61,8 +62,8 @@ def apply_manual_approvals(
         )
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as e:
+        data = orjson.loads(path.read_bytes())
+    except (orjson.JSONDecodeError, OSError) as e:
         raise ApprovalError(f"No se pudo leer {report_path}: {e}")
 
     packages = data.get("packages", [])
@@ -98,9 +99,7 @@ def apply_manual_approvals(
             1 for p in packages if isinstance(p, dict) and p.get("aprobacion_manual")
         )
 
-    path.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     return updated
 
 
@@ -5,11 +5,12 @@ template (``viewer/report_template.html``), producing a single ``report.html``
 that can be opened directly in a browser (no server required).
 """
 from __future__ import annotations
-import json
 import os
 import sys
 from pathlib import Path
 
+import orjson
+
 _PLACEHOLDER = "__REPORT_DATA__"
 _TEMPLATE_REL = os.path.join("viewer", "report_template.html")
 
@@ -45,15 +46,15 @@ def generate_html(
         return False
 
     try:
-        data = json.loads(report.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as e:
+        data = orjson.loads(report.read_bytes())
+    except (orjson.JSONDecodeError, OSError) as e:
         print(f"[ERROR] No se pudo leer {report_path}: {e}", file=sys.stderr)
         return False
 
     html = template.read_text(encoding="utf-8")
     # Embed as JSON inside the placeholder script tag. Escape '</' so the JSON
     # cannot prematurely close the <script> element.
-    payload = json.dumps(data, ensure_ascii=False).replace("</", "<\\/")
+    payload = orjson.dumps(data).decode("utf-8").replace("</", "<\\/")
     html = html.replace(_PLACEHOLDER, payload)
 
     Path(output_path).write_text(html, encoding="utf-8")
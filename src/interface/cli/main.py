@@ -15,10 +15,19 @@ from typing import List
 from pathlib import Path
 
 from src.application.dtos import AnalysisRequest
-from src.application.bootstrap import ApplicationFactory
-from src.infrastructure.adapters.markdown_report_adapter import MarkdownReportAdapter
-from src.infrastructure.adapters.logger_adapter import LoggerAdapter
-from src.infrastructure.config.settings import LoggingSettings
+
+# The application factory and adapters are imported inside the functions
+# that need them: importing them pulls in aiohttp, the whole adapter package
+# and the DI container, which ``--help`` and argument errors never use.
+
+
+# A requirements line is either a package name with an optional exact
+# version (``ok``) or a name followed by a range specifier (``range``), which
+# cannot be analyzed precisely. Anything else is an invalid specification.
+_SPEC_RE = re.compile(
+    r"^\s*(?:(?P<ok>[A-Za-z0-9_.-]+(?:==[A-Za-z0-9_.-]+)?)\s*$"
+    r"|(?P<range>[A-Za-z0-9_.-]+[<>!~]))"
+)
 
 
 class RequirementsFileError(Exception):
@@ -43,36 +52,28 @@ def read_requirements_file(path: str | Path = "requirements.scan.txt") -> List[s
         raise RequirementsFileError("No packages found in requirements.scan.txt")
 
     packages: List[str] = []
-    # Matches package name with optional exact version (==) only
-    exact_spec_re = re.compile(r"^\s*([A-Za-z0-9_.-]+(?:==[A-Za-z0-9_.-]+)?)\s*$")
-    # Detects range version specifiers that are not allowed
-    range_spec_re = re.compile(r"^\s*[A-Za-z0-9_.-]+[<>!~]")
-
-    with p.open("r", encoding="utf-8") as fh:
-        for line_num, raw in enumerate(fh, 1):
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            # Check for forbidden range specifiers first
-            if range_spec_re.match(line):
-                raise RequirementsFileError(
-                    f"Line {line_num}: Range version specifiers not supported: '{line}'\n"
-                    f"Only exact versions (==) or unspecified versions are allowed.\n"
-                    f"Example: 'requests==2.28.0' or 'requests'"
-                )
-
-            # Check if it matches our allowed pattern
-            m = exact_spec_re.match(line)
-            if m:
-                packages.append(m.group(1))
-            else:
-                raise RequirementsFileError(
-                    f"Line {line_num}: Invalid package specification: '{line}'\n"
-                    f"Only package names and exact versions (==) are allowed.\n"
-                    f"Example: 'requests==2.28.0' or 'requests'"
-                )
-    
+
+    for line_num, raw in enumerate(p.read_text(encoding="utf-8").splitlines(), 1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        m = _SPEC_RE.match(line)
+        if m and m.group("ok"):
+            packages.append(m.group("ok"))
+        elif m:
+            raise RequirementsFileError(
+                f"Line {line_num}: Range version specifiers not supported: '{line}'\n"
+                f"Only exact versions (==) or unspecified versions are allowed.\n"
+                f"Example: 'requests==2.28.0' or 'requests'"
+            )
+        else:
+            raise RequirementsFileError(
+                f"Line {line_num}: Invalid package specification: '{line}'\n"
+                f"Only package names and exact versions (==) are allowed.\n"
+                f"Example: 'requests==2.28.0' or 'requests'"
+            )
+
     if not packages:
         raise RequirementsFileError("No valid packages found in requirements file")
     
@@ -93,6 +94,9 @@ async def run_analysis(libraries: List[str], generate_markdown: bool = False) ->
     Raises:
         Exception: If analysis pipeline fails
     """
+    from src.application.bootstrap import ApplicationFactory
+    from src.infrastructure.adapters.markdown_report_adapter import MarkdownReportAdapter
+
     # Create application using factory (Clean Architecture)
     orchestrator, container = ApplicationFactory.create_application()
     
@@ -121,11 +125,15 @@ async def run_analysis(libraries: List[str], generate_markdown: bool = False) ->
         raise
     finally:
         # Clean up resources
-        container.close()
+        await container.aclose()
 
 
 def generate_markdown_only(report_path: str = "consolidated_report.json") -> None:
     """Generate markdown report from existing consolidated report."""
+    from src.infrastructure.adapters.logger_adapter import LoggerAdapter
+    from src.infrastructure.adapters.markdown_report_adapter import MarkdownReportAdapter
+    from src.infrastructure.config.settings import LoggingSettings
+
     logging_settings = LoggingSettings()
     logger = LoggerAdapter(logging_settings)
     markdown_adapter = MarkdownReportAdapter(logger)
@@ -119,7 +119,13 @@ class TestReadRequirementsFile:
     def test_rejects_range_specifiers(self, tmp_path: Path):
         f = tmp_path / "req.txt"
         f.write_text("requests>=2.0\n")
-        with pytest.raises(RequirementsFileError):
+        with pytest.raises(RequirementsFileError, match="Line 1: Range"):
+            read_requirements_file(str(f))
+
+    def test_rejects_invalid_specification(self, tmp_path: Path):
+        f = tmp_path / "req.txt"
+        f.write_text("flask\nrequests == 2.0\n")
+        with pytest.raises(RequirementsFileError, match="Line 2: Invalid"):
             read_requirements_file(str(f))
 
     def test_missing_file_raises(self):
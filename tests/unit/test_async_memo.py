@@ -0,0 +1,76 @@
+"""Unit tests for AsyncMemo – coalescing, LRU eviction, TTL, failure eviction."""
+
+import pytest
+import asyncio
+from unittest.mock import AsyncMock
+
+from src.infrastructure.utilities.async_memo import AsyncMemo
+
+
+# ── Tests ────────────────────────────────────────────────────────────
+
+
+class TestAsyncMemo:
+    """Tests for AsyncMemo.get_or_fetch()."""
+
+    @pytest.mark.asyncio
+    async def test_second_call_is_memoized(self):
+        memo = AsyncMemo()
+        fetch = AsyncMock(return_value="ok")
+
+        assert await memo.get_or_fetch("k", fetch) == "ok"
+        assert await memo.get_or_fetch("k", fetch) == "ok"
+        assert fetch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self):
+        memo = AsyncMemo()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(memo.get_or_fetch("k", fetch) for _ in range(5)))
+        assert results == [1] * 5
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        memo = AsyncMemo(maxsize=2)
+        for key in ("a", "b", "c"):
+            await memo.get_or_fetch(key, AsyncMock(return_value=key))
+        assert len(memo) == 2
+
+        fetch = AsyncMock(return_value="a2")
+        assert await memo.get_or_fetch("a", fetch) == "a2"
+        fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self):
+        memo = AsyncMemo(ttl_seconds=0.01)
+        fetch = AsyncMock(side_effect=["first", "second"])
+
+        assert await memo.get_or_fetch("k", fetch) == "first"
+        await asyncio.sleep(0.02)
+        assert await memo.get_or_fetch("k", fetch) == "second"
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_memoized(self):
+        memo = AsyncMemo()
+        fetch = AsyncMock(side_effect=[RuntimeError("boom"), "ok"])
+
+        with pytest.raises(RuntimeError):
+            await memo.get_or_fetch("k", fetch)
+        assert await memo.get_or_fetch("k", fetch) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_none_result_is_not_memoized(self):
+        memo = AsyncMemo()
+        fetch = AsyncMock(side_effect=[None, "ok"])
+
+        assert await memo.get_or_fetch("k", fetch) is None
+        assert await memo.get_or_fetch("k", fetch) == "ok"
+        assert fetch.await_count == 2
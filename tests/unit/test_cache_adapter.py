@@ -72,6 +72,22 @@ class TestCacheSetGet:
         assert _run(cache.get(key)) == "v2"
 
 
+class TestCacheEncoding:
+    """On-disk JSON encoding."""
+
+    @pytest.mark.asyncio
+    async def test_round_trips_nested_values_and_non_str_keys(self, cache):
+        key = cache.generate_key("encoding")
+        value = {"info": {"name": "pkg", "classifiers": ["A", "B"]}, 1: "one"}
+        await cache.set(key, value)
+
+        assert await cache.get(key) == {
+            "info": {"name": "pkg", "classifiers": ["A", "B"]},
+            "1": "one",
+        }
+        assert json.loads(cache._get_cache_file(key).read_text())["1"] == "one"
+
+
 class TestCacheTTL:
     """TTL expiration tests."""
 
@@ -0,0 +1,50 @@
+"""Tests for the report-only CLI commands (approve, HTML viewer)."""
+
+import orjson
+import pytest
+
+from src.interface.cli.approve import ApprovalError, apply_manual_approvals
+from src.interface.cli.html_report import generate_html
+
+
+def _write_report(path, packages):
+    path.write_bytes(orjson.dumps({"packages": packages, "summary": {}}))
+
+
+def test_apply_manual_approvals_updates_report(tmp_path):
+    report = tmp_path / "consolidated_report.json"
+    _write_report(report, [
+        {"package": "Requests", "version": "2.31.0", "aprobada": "No", "motivo_rechazo": "GPL"},
+        {"package": "flask", "version": "3.0.0", "aprobada": "Sí"},
+    ])
+
+    updated = apply_manual_approvals(["requests==2.31.0"], str(report), motivo="Revisado", por="ana")
+
+    data = orjson.loads(report.read_bytes())
+    pkg = data["packages"][0]
+    assert updated == 1
+    assert pkg["aprobada"] == "Sí"
+    assert pkg["aprobada_automatica"] == "No"
+    assert pkg["aprobada_manual_por"] == "ana"
+    assert data["summary"]["manual_approvals"] == 1
+    assert report.read_text(encoding="utf-8").startswith('{\n  "packages"')
+
+
+def test_apply_manual_approvals_invalid_json(tmp_path):
+    report = tmp_path / "consolidated_report.json"
+    report.write_text("{broken", encoding="utf-8")
+
+    with pytest.raises(ApprovalError, match="No se pudo leer"):
+        apply_manual_approvals(["requests"], str(report))
+
+
+def test_generate_html_embeds_escaped_report(tmp_path):
+    report = tmp_path / "consolidated_report.json"
+    _write_report(report, [{"package": "pkg", "summary": "Año </script>"}])
+    output = tmp_path / "report.html"
+
+    assert generate_html(str(report), str(output)) is True
+
+    html = output.read_text(encoding="utf-8")
+    assert "Año <\\/script>" in html
+    assert "__REPORT_DATA__" not in html
@@ -100,6 +100,24 @@ class TestPolicyEngine:
         assert evaluated[0].license is not None
         assert evaluated[0].license.name == "GPL-3.0"
 
+    def test_evaluate_licenses_normalizes_names(self) -> None:
+        """Blocked and package license names are compared after normalization."""
+        policy = Policy(name="test", description="Test policy", blocked_licenses=["gpl_v3.0"])
+        engine = PolicyEngine(policy)
+        blocked = Package(
+            identifier=PackageIdentifier(name="a", version="1.0.0"),
+            license=License(name="GPL-3", license_type=LicenseType.GPL_3_0)
+        )
+        allowed = Package(
+            identifier=PackageIdentifier(name="b", version="1.0.0"),
+            license=License(name="MIT", license_type=LicenseType.MIT)
+        )
+
+        engine.evaluate_licenses([blocked, allowed])
+
+        assert blocked.license is not None and blocked.license.is_rejected
+        assert allowed.license is not None and not allowed.license.is_rejected
+
 
 class TestGraphBuilder:
     """Test cases for GraphBuilder."""
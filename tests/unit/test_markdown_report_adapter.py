@@ -0,0 +1,36 @@
+"""Tests for MarkdownReportAdapter."""
+
+from unittest.mock import MagicMock
+
+import orjson
+
+from src.infrastructure.adapters.markdown_report_adapter import MarkdownReportAdapter
+
+
+def test_generate_markdown_from_report(tmp_path):
+    report = tmp_path / "consolidated_report.json"
+    report.write_bytes(orjson.dumps({"packages": [
+        {"package": "requests", "version": "2.31.0", "license": "Apache 2.0",
+         "requires_dist": ["urllib3>=1.21", "pytest; extra == 'test'"]},
+        {"package": "urllib3", "version": "2.0.7", "license": "MIT"},
+    ]}))
+    output = tmp_path / "packages.md"
+
+    adapter = MarkdownReportAdapter(MagicMock())
+
+    assert adapter.generate_markdown(str(report), str(output)) is True
+    content = output.read_text(encoding="utf-8")
+    assert "| 1 | `requests` | 2.31.0 | Apache 2.0 | ✅ Activo |" in content
+    assert "requests\n  urllib3" in content
+    assert "pytest" not in content
+
+
+def test_generate_markdown_invalid_json(tmp_path):
+    report = tmp_path / "consolidated_report.json"
+    report.write_text("{not json", encoding="utf-8")
+    logger = MagicMock()
+
+    adapter = MarkdownReportAdapter(logger)
+
+    assert adapter.generate_markdown(str(report), str(tmp_path / "packages.md")) is False
+    assert "Invalid JSON" in logger.error.call_args[0][0]
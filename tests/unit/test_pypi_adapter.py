@@ -6,11 +6,15 @@ Uses mocks for all HTTP calls (aiohttp) and CachePort.
 
 import pytest
 import asyncio
+import orjson
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 
 from src.domain.entities import Package, PackageIdentifier, License
-from src.infrastructure.adapters.pypi_adapter import PyPIClientAdapter
+from src.infrastructure.adapters.pypi_adapter import (
+    PyPIClientAdapter,
+    _slim_pypi_payload,
+)
 from src.infrastructure.config.settings import APISettings
 
 
@@ -60,6 +64,17 @@ def _make_package(name="requests", version="2.31.0", **kwargs) -> Package:
     return Package(identifier=PackageIdentifier(name, version), **kwargs)
 
 
+def _fake_session(status, body=None, headers=None):
+    """Session whose ``get`` answers every request with one canned response."""
+    response = MagicMock(status=status, headers=headers or {})
+    response.read = AsyncMock(return_value=orjson.dumps(body))
+    request = MagicMock()
+    request.__aenter__.return_value = response
+    session = MagicMock(closed=False)
+    session.get.return_value = request
+    return session
+
+
 FAKE_PYPI_RESPONSE = {
     "info": {
         "name": "requests",
@@ -120,8 +135,11 @@ class TestEnrichPackageMetadata:
 
         with patch.object(
             adapter, "_fetch_pypi_metadata", new_callable=AsyncMock
-        ) as mock_pypi:
+        ) as mock_pypi, patch.object(
+            adapter, "_fetch_latest_version_info", new_callable=AsyncMock
+        ) as mock_latest:
             mock_pypi.return_value = None
+            mock_latest.return_value = (None, None)
             result = await adapter.enrich_package_metadata(pkg)
 
         assert result is pkg  # exact same object
@@ -132,12 +150,41 @@ class TestEnrichPackageMetadata:
 
         with patch.object(
             adapter, "_fetch_pypi_metadata", new_callable=AsyncMock
-        ) as mock_pypi:
+        ) as mock_pypi, patch.object(
+            adapter, "_fetch_latest_version_info", new_callable=AsyncMock
+        ) as mock_latest:
             mock_pypi.side_effect = RuntimeError("network error")
+            mock_latest.return_value = (None, None)
             result = await adapter.enrich_package_metadata(pkg)
 
         assert result is pkg
 
+    @pytest.mark.asyncio
+    async def test_pypi_and_latest_fetched_concurrently(self, adapter):
+        """The versioned and latest-version lookups overlap in time."""
+        pkg = _make_package()
+        latest_started = asyncio.Event()
+
+        async def fake_pypi(name, version):
+            await asyncio.wait_for(latest_started.wait(), timeout=1)
+            return FAKE_PYPI_RESPONSE
+
+        async def fake_latest(name):
+            latest_started.set()
+            return ("2.32.0", None)
+
+        with patch.object(
+            adapter, "_fetch_pypi_metadata", side_effect=fake_pypi
+        ), patch.object(
+            adapter, "_fetch_latest_version_info", side_effect=fake_latest
+        ), patch.object(
+            adapter, "_fetch_github_metadata", new_callable=AsyncMock
+        ) as mock_gh:
+            mock_gh.return_value = None
+            result = await adapter.enrich_package_metadata(pkg)
+
+        assert result.latest_version == "2.32.0"
+
     @pytest.mark.asyncio
     async def test_enrich_calls_github_when_url_available(self, adapter):
         pkg = _make_package()
@@ -231,6 +278,78 @@ class TestCacheStats:
         assert adapter._pypi_cache_hits == 0
 
 
+# ── In-process memo ──────────────────────────────────────────────────
+
+
+class TestInProcessMemo:
+    """Tests for the in-process memoization of PyPI lookups."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_fetch_is_memoized(self, adapter):
+        """Repeated (name, version) lookups hit PyPI only once per run."""
+        with patch.object(
+            adapter.retry_policy, "execute", new_callable=AsyncMock
+        ) as mock_retry:
+            mock_retry.return_value = FAKE_PYPI_RESPONSE
+            first = await adapter._fetch_pypi_metadata("Requests", "2.31.0")
+            second = await adapter._fetch_pypi_metadata("requests", "2.31.0")
+
+        assert first == second == FAKE_PYPI_RESPONSE
+        assert mock_retry.call_count == 1
+        assert adapter._pypi_cache_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_retried_later_in_the_run(self, adapter):
+        """A timeout or 5xx (returned as None) must not stick for the run."""
+        with patch.object(
+            adapter.retry_policy, "execute", new_callable=AsyncMock
+        ) as mock_retry:
+            mock_retry.side_effect = [None, FAKE_PYPI_RESPONSE]
+            first = await adapter._fetch_pypi_metadata("requests", "2.31.0")
+            second = await adapter._fetch_pypi_metadata("requests", "2.31.0")
+
+        assert first is None
+        assert second == FAKE_PYPI_RESPONSE
+
+    @pytest.mark.asyncio
+    async def test_failed_latest_lookup_is_not_memoized(self, adapter):
+        with patch.object(
+            adapter, "_fetch_project_json", new_callable=AsyncMock
+        ) as mock_project:
+            mock_project.side_effect = [None, FAKE_PYPI_RESPONSE]
+            assert await adapter.fetch_latest_version("requests") is None
+            assert await adapter.fetch_latest_version("requests") == "2.31.0"
+
+    @pytest.mark.asyncio
+    async def test_latest_version_is_memoized(self, adapter):
+        with patch.object(
+            adapter, "_load_latest_version_info", new_callable=AsyncMock
+        ) as mock_load:
+            mock_load.return_value = ("2.32.0", None)
+            await adapter.fetch_latest_version("requests")
+            version = await adapter.fetch_latest_version("Requests")
+
+        assert version == "2.32.0"
+        mock_load.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_version_fallback_shares_project_fetch(self, adapter):
+        """A 404 fallback and the latest lookup issue one /{name}/json call."""
+        adapter._session = _fake_session(404)
+        with patch.object(
+            adapter, "_load_project_json", new_callable=AsyncMock
+        ) as mock_project:
+            mock_project.return_value = FAKE_PYPI_RESPONSE
+            data, (latest, _) = await asyncio.gather(
+                adapter._fetch_pypi_metadata("requests", "0.0.1"),
+                adapter._fetch_latest_version_info("requests"),
+            )
+
+        assert data == FAKE_PYPI_RESPONSE
+        assert latest == "2.31.0"
+        mock_project.assert_called_once_with("requests")
+
+
 # ── No cache adapter ─────────────────────────────────────────────────
 
 
@@ -278,6 +397,38 @@ class TestMergePypiData:
         result = adapter._merge_pypi_data(pkg, {"info": "not_a_dict"})
         assert result is pkg
 
+    def test_preserves_latest_version_fields(self, adapter):
+        ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        pkg = _make_package(latest_version="3.0.0", latest_upload_time=ts)
+        result = adapter._merge_pypi_data(pkg, FAKE_PYPI_RESPONSE)
+        assert result.latest_version == "3.0.0"
+        assert result.latest_upload_time == ts
+        assert result is not pkg
+
+    def test_normalizes_string_and_list_fields(self, adapter):
+        data = {"info": {
+            "summary": "  padded  ",
+            "author": "   ",
+            "keywords": 42,
+            "classifiers": ("A", 1),
+            "requires_dist": None,
+        }}
+        result = adapter._merge_pypi_data(_make_package(), data)
+        assert result.summary == "padded"
+        assert result.author is None
+        assert result.keywords is None
+        assert result.classifiers == ["A", "1"]
+        assert result.requires_dist == []
+
+    def test_safe_list_coerces_non_strings(self, adapter):
+        assert adapter._safe_list(["a", 1, None]) == ["a", "1", "None"]
+        assert adapter._safe_list(("x",)) == ["x"]
+        assert adapter._safe_list("not-a-list") == []
+
+    def test_safe_dict_coerces_and_skips_none(self, adapter):
+        assert adapter._safe_dict({"a": "x", 1: 2, "b": None}) == {"a": "x", "1": "2"}
+        assert adapter._safe_dict(["not", "a", "dict"]) == {}
+
 
 # ── _merge_github_data ───────────────────────────────────────────────
 
@@ -319,6 +470,18 @@ class TestMergeGithubData:
         result = adapter._merge_github_data(pkg, github_data)
         assert "Apache" in result.license.name
 
+    def test_keeps_other_fields_when_pushed_at_missing(self, adapter):
+        ts = datetime(2023, 5, 1, tzinfo=timezone.utc)
+        pkg = _make_package(
+            github_url="https://github.com/psf/requests",
+            latest_version="3.0.0",
+            last_commit_date=ts,
+        )
+        result = adapter._merge_github_data(pkg, {})
+        assert result.last_commit_date == ts
+        assert result.latest_version == "3.0.0"
+        assert result.github_url == pkg.github_url
+
 
 # ── _parse_github_pushed_at ──────────────────────────────────────────
 
@@ -338,3 +501,204 @@ class TestParseGithubPushedAt:
         assert PyPIClientAdapter._parse_github_pushed_at(
             {"pushed_at": "not-a-date"}
         ) is None
+
+    def test_z_suffix_is_utc(self):
+        result = PyPIClientAdapter._parse_github_pushed_at(
+            {"pushed_at": "2024-06-15T12:00:00Z"}
+        )
+        assert result == datetime(2024, 6, 15, 12, 0, tzinfo=timezone.utc)
+
+
+# ── _extract_github_url ──────────────────────────────────────────────
+
+
+class TestExtractGithubUrl:
+    def test_prefers_project_urls(self, adapter):
+        url = adapter._extract_github_url(
+            {"Docs": "https://docs.example.com", "Source": "https://GitHub.com/o/r"},
+            "https://github.com/other/home",
+            None,
+            None,
+        )
+        assert url == "https://GitHub.com/o/r"
+
+    def test_repository_labels_win_over_other_links(self, adapter):
+        url = adapter._extract_github_url(
+            {
+                "Documentation": "https://github.com/o/r/wiki",
+                "Repository": "https://github.com/o/r",
+            },
+            None,
+            None,
+            None,
+        )
+        assert url == "https://github.com/o/r"
+
+    def test_falls_back_to_home_page(self, adapter):
+        url = adapter._extract_github_url({}, "https://github.com/o/r", None, None)
+        assert url == "https://github.com/o/r"
+
+    def test_scans_description(self, adapter):
+        url = adapter._extract_github_url(
+            {}, None, "summary", "See https://github.com/o/r for details"
+        )
+        assert url == "https://github.com/o/r"
+
+    def test_none_when_absent(self, adapter):
+        assert adapter._extract_github_url({}, None, None, None) is None
+
+    def test_first_match_wins(self, adapter):
+        url = adapter._extract_github_url(
+            {},
+            None,
+            "Fork of https://github.com/org/project-extended",
+            "Upstream: https://github.com/org/proj",
+        )
+        assert url == "https://github.com/org/project-extended"
+
+    def test_description_scan_is_capped(self, adapter):
+        description = "x" * 5000 + " https://github.com/o/r"
+        assert adapter._extract_github_url({}, None, None, description) is None
+
+
+# ── _parse_github_repo ───────────────────────────────────────────────
+
+
+class TestParseGithubRepo:
+    @pytest.mark.parametrize("url,expected", [
+        ("https://github.com/psf/requests", ("psf", "requests")),
+        ("http://github.com/psf/requests/tree/main", ("psf", "requests")),
+        ("https://github.com/psf/requests.git", ("psf", "requests")),
+        ("https://github.com/psf/requests#readme", ("psf", "requests")),
+    ])
+    def test_valid_urls(self, url, expected):
+        assert PyPIClientAdapter._parse_github_repo(url) == expected
+
+    @pytest.mark.parametrize("url", [
+        "https://gitlab.com/psf/requests",
+        "https://github.com/psf",
+        "https://github.com//requests",
+    ])
+    def test_invalid_urls(self, url):
+        assert PyPIClientAdapter._parse_github_repo(url) is None
+
+
+# ── _slim_pypi_payload ───────────────────────────────────────────────
+
+
+class TestSlimPypiPayload:
+    def test_drops_unused_sections(self):
+        payload = {
+            "info": {"name": "requests"},
+            "urls": [{"upload_time": "a"}, {"upload_time": "b"}],
+            "releases": {"1.0": []},
+            "vulnerabilities": [],
+        }
+        assert _slim_pypi_payload(payload) == {
+            "info": {"name": "requests"},
+            "urls": [{"upload_time": "a"}],
+        }
+
+    def test_missing_urls(self):
+        assert _slim_pypi_payload({"info": {}})["urls"] == []
+
+
+# ── Conditional GET validators ───────────────────────────────────────
+
+
+class TestHttpValidators:
+    def test_conditional_headers_empty_without_validators(self):
+        assert PyPIClientAdapter._conditional_headers(None) == {}
+
+    def test_conditional_headers_from_validators(self):
+        headers = PyPIClientAdapter._conditional_headers(
+            {"etag": '"abc"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        )
+        assert headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+
+    @pytest.mark.asyncio
+    async def test_store_skips_responses_without_validators(self, adapter):
+        await adapter._store_http_validators("https://x", {}, {"info": {}})
+        adapter._cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_store_persists_etag_and_body(self, adapter):
+        await adapter._store_http_validators(
+            "https://x", {"ETag": '"abc"'}, {"info": {}}
+        )
+        key, value = adapter._cache.set.call_args.args
+        assert key == "http_validators|https://x"
+        assert value == {"etag": '"abc"', "last_modified": None, "body": {"info": {}}}
+
+    @pytest.mark.asyncio
+    async def test_versioned_fetch_is_a_plain_get(self, adapter):
+        adapter._session = _fake_session(
+            200, FAKE_PYPI_RESPONSE, headers={"ETag": '"abc"'}
+        )
+
+        result = await adapter._fetch_pypi_metadata("requests", "2.31.0")
+
+        assert result == FAKE_PYPI_RESPONSE
+        assert adapter._session.get.call_args.kwargs["headers"] == {}
+        stored_keys = [c.args[0] for c in adapter._cache.set.call_args_list]
+        assert not any(k.startswith("http_validators") for k in stored_keys)
+
+    @pytest.mark.asyncio
+    async def test_get_json_returns_status_without_body_on_error(self, adapter):
+        adapter._session = _fake_session(404, headers={"X-Test": "1"})
+        status, data, headers = await adapter._get_json(
+            "https://x", headers={"Accept": "application/json"}
+        )
+        assert (status, data) == (404, None)
+        assert headers["X-Test"] == "1"
+        adapter._cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_json_transforms_and_stores_body(self, adapter):
+        adapter._session = _fake_session(
+            200, body={"info": {}, "releases": {}}, headers={"ETag": '"v1"'}
+        )
+        status, data, _ = await adapter._get_json(
+            "https://x", transform=_slim_pypi_payload
+        )
+        assert status == 200
+        assert data == {"info": {}, "urls": []}
+        assert adapter._cache.set.call_args.args[1]["body"] == data
+
+    @pytest.mark.asyncio
+    async def test_get_json_answers_304_from_stored_body(self, adapter):
+        stored = {"etag": '"v1"', "last_modified": None, "body": {"info": {"name": "x"}}}
+        adapter._cache.get.side_effect = (
+            lambda key: stored if key == "http_validators|https://x" else None
+        )
+        adapter._session = _fake_session(304, headers={"ETag": '"v1"'})
+
+        status, data, _ = await adapter._get_json("https://x")
+
+        request_headers = adapter._session.get.call_args.kwargs["headers"]
+        assert request_headers["If-None-Match"] == '"v1"'
+        assert (status, data) == (200, stored["body"])
+        adapter._session.get.return_value.__aenter__.return_value.read.assert_not_called()
+        adapter._cache.set.assert_not_called()
+
+
+# ── Shared session lifecycle ─────────────────────────────────────────
+
+
+class TestSessionLifecycle:
+    @pytest.mark.asyncio
+    async def test_session_is_reused_until_closed(self, adapter):
+        first = await adapter._get_session()
+        assert await adapter._get_session() is first
+
+        await adapter.aclose()
+        assert first.closed
+        assert adapter._session is None
+
+    @pytest.mark.asyncio
+    async def test_aclose_without_session_is_noop(self, adapter):
+        await adapter.aclose()
+        assert adapter._session is None
@@ -102,3 +102,34 @@ class TestCalculateDelay:
         delays = {policy._calculate_delay(0) for _ in range(20)}
         # With jitter, we should get multiple unique values
         assert len(delays) > 1
+
+
+class TestRetryClassification:
+    """Tests for retry_on / give_up short-circuiting."""
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_propagates_immediately(self):
+        policy = RetryPolicy(max_retries=3, base_delay_seconds=0.01, retry_on=(ConnectionError,))
+        func = AsyncMock(side_effect=KeyError("bug"))
+        with pytest.raises(KeyError):
+            await policy.execute(func)
+        assert func.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retryable_error_is_retried(self):
+        policy = RetryPolicy(max_retries=3, base_delay_seconds=0.01, retry_on=(ConnectionError,))
+        func = AsyncMock(side_effect=[ConnectionError, "ok"])
+        assert await policy.execute(func) == "ok"
+        assert func.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_give_up_skips_remaining_attempts(self):
+        policy = RetryPolicy(
+            max_retries=3,
+            base_delay_seconds=0.01,
+            give_up=lambda e: "401" in str(e),
+        )
+        func = AsyncMock(side_effect=RuntimeError("401 Unauthorized"))
+        with pytest.raises(RuntimeError):
+            await policy.execute(func)
+        assert func.await_count == 1
@@ -1,6 +1,7 @@
 """Unit tests for settings parsing from environment variables."""
 
-from src.infrastructure.config.settings import APISettings
+from src.infrastructure.config import settings as settings_module
+from src.infrastructure.config.settings import APISettings, CacheSettings
 
 
 class TestAPISettings:
@@ -16,3 +17,52 @@ class TestAPISettings:
             monkeypatch.setenv("UV_ALLOW_PRERELEASE", value)
             settings = APISettings.from_env()
             assert settings.uv_allow_prerelease is True
+
+    def test_concurrency_defaults(self, monkeypatch):
+        monkeypatch.delenv("PYPI_CONCURRENCY", raising=False)
+        monkeypatch.delenv("GITHUB_CONCURRENCY", raising=False)
+        settings = APISettings.from_env()
+        assert settings.pypi_concurrency == 16
+        assert settings.github_concurrency == 5
+
+    def test_concurrency_from_env(self, monkeypatch):
+        monkeypatch.setenv("PYPI_CONCURRENCY", "8")
+        monkeypatch.setenv("GITHUB_CONCURRENCY", "2")
+        settings = APISettings.from_env()
+        assert settings.pypi_concurrency == 8
+        assert settings.github_concurrency == 2
+
+    def test_uv_concurrency_default_scales_with_cpus(self, monkeypatch):
+        monkeypatch.delenv("UV_CONCURRENCY", raising=False)
+        monkeypatch.setattr("os.cpu_count", lambda: 16)
+        assert APISettings.from_env().uv_concurrency == 4
+        monkeypatch.setattr("os.cpu_count", lambda: 2)
+        assert APISettings.from_env().uv_concurrency == 2
+
+    def test_uv_concurrency_from_env(self, monkeypatch):
+        monkeypatch.setenv("UV_CONCURRENCY", "3")
+        assert APISettings.from_env().uv_concurrency == 3
+
+
+class TestCacheSettings:
+    """Tests for CacheSettings.from_env()."""
+
+    def test_enabled_flag(self, monkeypatch):
+        monkeypatch.delenv("CACHE_ENABLED", raising=False)
+        assert CacheSettings.from_env().enabled is True
+        for value, expected in (("false", False), ("0", False), ("TRUE", True), ("1", True)):
+            monkeypatch.setenv("CACHE_ENABLED", value)
+            assert CacheSettings.from_env().enabled is expected
+
+
+class TestGetSettings:
+    """Tests for the global settings accessor."""
+
+    def test_dotenv_loaded_once_on_first_use(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(settings_module, "load_dotenv", lambda *a, **kw: calls.append(1))
+        monkeypatch.setattr(settings_module, "_settings", None)
+
+        first = settings_module.get_settings()
+        assert settings_module.get_settings() is first
+        assert len(calls) == 1
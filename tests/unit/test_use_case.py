@@ -201,6 +201,27 @@ class TestAnalyzePackagesUseCase:
         assert "click" in names
 
 
+# ── _short_license ───────────────────────────────────────────────────
+
+
+class TestShortLicense:
+    """Tests for the report's short license formatting."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("MIT License", "MIT"),
+        ('"New BSD License"', "BSD"),
+        ("BSD 3-Clause", "BSD-3-Clause"),
+        ("Apache 2.0", "Apache-2.0"),
+        ("Apache Software License", "Apache"),
+        ("All Rights Reserved", "Proprietary"),
+        ("PSF-2.0\nPython Software Foundation", "PSF-2.0"),
+        ("—", "—"),
+        ("", "—"),
+    ])
+    def test_short_license(self, use_case, raw, expected):
+        assert use_case._short_license(raw) == expected
+
+
 # ── AnalysisRequest validation ───────────────────────────────────────
 
 